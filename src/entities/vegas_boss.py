@@ -1,5 +1,6 @@
 import math
 import random
+from dataclasses import dataclass
 from enum import Enum
 
 import pygame
@@ -7,6 +8,22 @@ import pygame
 from src.managers.sound_manager import SoundManager
 
 
+@dataclass(slots=True)
+class Particle:
+    """A single hit-spark particle.
+
+    Slots keep particles compact and make attribute access cheaper than
+    dict key lookups in the per-frame update loop.
+    """
+
+    x: float
+    y: float
+    vx: float
+    vy: float
+    lifetime: float
+    color: tuple[int, int, int]
+
+
 class BossPhase(Enum):
     PHASE_1_HAPPY = "happy"
     PHASE_2_ANGRY = "angry"
@@ -36,6 +53,10 @@ class Projectile:
         self.lifetime = 0
         self.rect = pygame.Rect(x - size // 2, y - size // 2, size, size)
 
+        # Pre-render the glow once; color and size never change after init
+        self._glow_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self._glow_surf, (*color, 50), (size, size), size)
+
     def update(self, dt: float):
         """Update projectile position."""
         self.x += self.vx * dt
@@ -63,12 +84,8 @@ class Projectile:
             pygame.draw.circle(
                 screen, self.color, (draw_x, int(self.y)), self.size // 2
             )
-            # Add glow effect
-            glow_surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                glow_surf, (*self.color, 50), (self.size, self.size), self.size
-            )
-            screen.blit(glow_surf, (draw_x - self.size, int(self.y) - self.size))
+            # Add glow effect (pre-rendered in __init__)
+            screen.blit(self._glow_surf, (draw_x - self.size, int(self.y) - self.size))
 
 
 class VegasBoss:
@@ -106,7 +123,11 @@ class VegasBoss:
 
         # Visual effects
         self.hit_flash_timer = 0
-        self.particles = []
+        self.particles: list[Particle] = []
+        # Invulnerability glows, one per phase color at the base size;
+        # draw rescales on blit, so the transition wobble and transient
+        # hit-flash tints never grow the cache past the phases
+        self._glow_cache: dict[tuple[int, int, int], pygame.Surface] = {}
 
         # Collision
         self.rect = pygame.Rect(
@@ -168,14 +189,14 @@ class VegasBoss:
                 angle = random.uniform(0, math.pi * 2)
                 speed = random.uniform(100, 300)
                 self.particles.append(
-                    {
-                        "x": self.x,
-                        "y": self.y,
-                        "vx": math.cos(angle) * speed,
-                        "vy": math.sin(angle) * speed,
-                        "lifetime": 0,
-                        "color": self.get_phase_color(),
-                    }
+                    Particle(
+                        x=self.x,
+                        y=self.y,
+                        vx=math.cos(angle) * speed,
+                        vy=math.sin(angle) * speed,
+                        lifetime=0,
+                        color=self.get_phase_color(),
+                    )
                 )
 
     def update_movement(self, dt: float, player_x: float):
@@ -317,11 +338,11 @@ class VegasBoss:
 
         # Update particles
         for particle in self.particles[:]:
-            particle["x"] += particle["vx"] * dt
-            particle["y"] += particle["vy"] * dt
-            particle["vy"] += 300 * dt  # Gravity
-            particle["lifetime"] += dt
-            if particle["lifetime"] > 1.0:
+            particle.x += particle.vx * dt
+            particle.y += particle.vy * dt
+            particle.vy += 300 * dt  # Gravity
+            particle.lifetime += dt
+            if particle.lifetime > 1.0:
                 self.particles.remove(particle)
 
         # Update visual effects
@@ -350,22 +371,18 @@ class VegasBoss:
 
         # Draw particles
         for particle in self.particles:
-            p_x = int(particle["x"] - camera_offset)
-            p_y = int(particle["y"])
-            alpha = 1.0 - particle["lifetime"]
-            p_color = tuple(int(c * alpha) for c in particle["color"])
+            p_x = int(particle.x - camera_offset)
+            p_y = int(particle.y)
+            alpha = 1.0 - particle.lifetime
+            p_color = tuple(int(c * alpha) for c in particle.color)
             pygame.draw.circle(screen, p_color, (p_x, p_y), 5)
 
         # Draw main sphere with scale
         size = int(self.size * self.scale)
 
-        # Glow effect
+        # Glow effect (cached so each frame is a blit, not an alloc + fill)
         if self.invulnerable:
-            glow_surf = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
-            glow_color = (*color, 50)
-            pygame.draw.circle(
-                glow_surf, glow_color, (size * 3 // 2, size * 3 // 2), size * 3 // 2
-            )
+            glow_surf = self._get_glow_surface(size)
             screen.blit(glow_surf, (draw_x - size * 3 // 2, draw_y - size * 3 // 2))
 
         # Main body
@@ -379,6 +396,30 @@ class VegasBoss:
         for projectile in self.projectiles:
             projectile.draw(screen, camera_offset)
 
+    def _get_glow_surface(self, size: int) -> pygame.Surface:
+        """Get the invulnerability glow scaled to the current size.
+
+        One glow per phase color is rendered at the base size and
+        cached; other sizes rescale that surface on blit. The transition
+        wobble animates ``size`` and the hit flash interpolates a fresh
+        color every frame, so keying on either would grow the cache
+        without bound.
+        """
+        color = self.get_phase_color()
+        base = self._glow_cache.get(color)
+        if base is None:
+            base = pygame.Surface((self.size * 3, self.size * 3), pygame.SRCALPHA)
+            pygame.draw.circle(
+                base,
+                (*color, 50),
+                (self.size * 3 // 2, self.size * 3 // 2),
+                self.size * 3 // 2,
+            )
+            self._glow_cache[color] = base
+        if size == self.size:
+            return base
+        return pygame.transform.smoothscale(base, (size * 3, size * 3))
+
     def draw_face(self, screen, x: int, y: int, size: int):
         """Draw the boss face based on current phase."""
         face_color = (0, 0, 0)
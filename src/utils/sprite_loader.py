@@ -5,25 +5,52 @@ import pygame
 
 from src.config.constants import COLOR_PLACEHOLDER
 
+# Negative cache: paths already known to be missing or unloadable. Repeated
+# calls for the same bad path skip the os.path.exists syscall and the
+# placeholder allocation entirely.
+_MISSING_PATHS: set[str] = set()
+_PLACEHOLDER_SURFACE: pygame.Surface | None = None
+
+
+def _missing_placeholder() -> pygame.Surface:
+    """Return the shared magenta placeholder surface, creating it on first use."""
+    global _PLACEHOLDER_SURFACE
+    if _PLACEHOLDER_SURFACE is None:
+        _PLACEHOLDER_SURFACE = pygame.Surface((64, 64))
+        _PLACEHOLDER_SURFACE.fill(COLOR_PLACEHOLDER)  # Magenta placeholder
+    return _PLACEHOLDER_SURFACE
+
+
+def clear_sprite_cache() -> None:
+    """Forget cached missing paths (e.g. after assets are downloaded)."""
+    global _PLACEHOLDER_SURFACE
+    _MISSING_PATHS.clear()
+    _PLACEHOLDER_SURFACE = None
+
 
 def load_image(path: str, scale: tuple | None = None) -> pygame.Surface:
     """Load an image from an absolute path."""
+    if path in _MISSING_PATHS:
+        return _missing_placeholder()
+
     if not os.path.exists(path):
-        # Create a placeholder surface if image doesn't exist
-        surface = pygame.Surface((64, 64))
-        surface.fill(COLOR_PLACEHOLDER)  # Magenta placeholder
-        return surface
+        _MISSING_PATHS.add(path)
+        return _missing_placeholder()
 
     try:
-        surface = pygame.image.load(path).convert_alpha()
+        surface = pygame.image.load(path)
         if scale:
-            surface = pygame.transform.scale(surface, scale)
-        return surface
-    except pygame.error:
-        # Create a placeholder surface if loading fails
-        surface = pygame.Surface((64, 64))
-        surface.fill(COLOR_PLACEHOLDER)  # Magenta placeholder
-        return surface
+            if surface.get_bitsize() < 24:
+                # smoothscale only handles 24/32-bit surfaces; promote
+                # paletted images before scaling
+                surface = surface.convert_alpha()
+            # Scale first so convert_alpha runs over the (usually smaller)
+            # output surface instead of the full-size source image.
+            surface = pygame.transform.smoothscale(surface, scale)
+        return surface.convert_alpha()
+    except (pygame.error, ValueError):
+        _MISSING_PATHS.add(path)
+        return _missing_placeholder()
 
 
 def load_character_individual_files(
@@ -112,6 +139,61 @@ def load_character_individual_files(
     return animations
 
 
+def load_characters_from_atlas(
+    atlas_path: str, manifest_path: str
+) -> dict[str, dict[str, list[pygame.Surface]]]:
+    """Load every character's animations from a single packed atlas.
+
+    The atlas is built offline and described by a JSON manifest mapping
+    character names to animations to frame rects::
+
+        {"danger": {"walking": [[0, 0, 256, 256], ...], ...}, ...}
+
+    Loading one packed texture replaces one sheet load per character, so
+    startup does a single disk read and ``convert_alpha`` for all of them.
+    Frames are ``subsurface`` views into the atlas, not copies.
+
+    Args:
+        atlas_path: Path to the packed atlas PNG
+        manifest_path: Path to the JSON manifest of frame rects
+
+    Returns:
+        Dictionary mapping character names to animation dictionaries
+    """
+    if not os.path.exists(atlas_path) or not os.path.exists(manifest_path):
+        return {}
+
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+    try:
+        atlas = pygame.image.load(atlas_path).convert_alpha()
+    except pygame.error:
+        return {}
+
+    characters: dict[str, dict[str, list[pygame.Surface]]] = {}
+
+    for character_name, animations in manifest.items():
+        character_frames: dict[str, list[pygame.Surface]] = {}
+        for animation_name, rects in animations.items():
+            frames = []
+            for rect in rects:
+                try:
+                    frames.append(atlas.subsurface(pygame.Rect(rect)))
+                except ValueError:
+                    # Rect outside the atlas - use a placeholder frame
+                    placeholder = pygame.Surface((64, 64))
+                    placeholder.fill(COLOR_PLACEHOLDER)
+                    frames.append(placeholder)
+            character_frames[animation_name] = frames
+        characters[character_name] = character_frames
+
+    return characters
+
+
 def load_sprite_sheet(
     path: str, frame_width: int, frame_height: int, scale: tuple | None = None
 ) -> list:
@@ -148,6 +230,20 @@ def load_sprite_sheet(
         return [placeholder]
 
 
+# Sheets whose pixel data exceeds this are extracted in Morton (Z) order so
+# neighbouring frames stay cache-resident; smaller sheets keep raster order.
+_MORTON_ATLAS_BYTES = 8 * 1024 * 1024
+
+
+def _morton_key(col: int, row: int) -> int:
+    """Interleave the bits of a grid coordinate to get its Z-order index."""
+    key = 0
+    for bit in range(16):
+        key |= ((col >> bit) & 1) << (2 * bit)
+        key |= ((row >> bit) & 1) << (2 * bit + 1)
+    return key
+
+
 def load_character_animations(
     path: str,
     frame_width: int = 256,
@@ -167,31 +263,37 @@ def load_character_animations(
 
     try:
         sheet = pygame.image.load(path).convert_alpha()
-        animations = {"walking": [], "jumping": [], "attacking": []}
 
-        # Row 0: Walking animation (4 frames)
-        for x in range(0, 4 * frame_width, frame_width):
-            frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (x, 0, frame_width, frame_height))
-            if scale:
-                frame = pygame.transform.scale(frame, scale)
-            animations["walking"].append(frame)
+        # Grid layout: row 0 walking (4 frames), row 1 jumping (4 frames),
+        # row 2 attacking (3 frames, ignoring the effect frame).
+        jobs = []  # (animation, slot, col, row)
+        for row, (animation, frame_count) in enumerate(
+            [("walking", 4), ("jumping", 4), ("attacking", 3)]
+        ):
+            for col in range(frame_count):
+                jobs.append((animation, col, col, row))
+
+        animations = {
+            "walking": [None] * 4,
+            "jumping": [None] * 4,
+            "attacking": [None] * 3,
+        }
 
-        # Row 1: Jumping animation (4 frames)
-        for x in range(0, 4 * frame_width, frame_width):
-            frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (x, frame_height, frame_width, frame_height))
-            if scale:
-                frame = pygame.transform.scale(frame, scale)
-            animations["jumping"].append(frame)
+        # On sheets too big to stay cache-resident, walk frames in Z order
+        # so adjacent frames are extracted while their rows are still hot.
+        if len(jobs) * frame_width * frame_height * 4 > _MORTON_ATLAS_BYTES:
+            jobs.sort(key=lambda job: _morton_key(job[2], job[3]))
 
-        # Row 2: Attacking animation (3 frames, ignoring the effect frame)
-        for x in range(0, 3 * frame_width, frame_width):
+        for animation, slot, col, row in jobs:
             frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (x, 2 * frame_height, frame_width, frame_height))
+            frame.blit(
+                sheet,
+                (0, 0),
+                (col * frame_width, row * frame_height, frame_width, frame_height),
+            )
             if scale:
                 frame = pygame.transform.scale(frame, scale)
-            animations["attacking"].append(frame)
+            animations[animation][slot] = frame
 
         return animations
 
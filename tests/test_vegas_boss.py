@@ -186,12 +186,12 @@ class TestVegasBoss:
 
         # Particles should have correct properties
         for particle in boss.particles:
-            assert "x" in particle
-            assert "y" in particle
-            assert "vx" in particle
-            assert "vy" in particle
-            assert "lifetime" in particle
-            assert "color" in particle
+            assert hasattr(particle, "x")
+            assert hasattr(particle, "y")
+            assert hasattr(particle, "vx")
+            assert hasattr(particle, "vy")
+            assert hasattr(particle, "lifetime")
+            assert hasattr(particle, "color")
 
     def test_attack_timing(self, boss):
         """Test attack cooldown mechanics."""
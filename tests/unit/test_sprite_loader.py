@@ -7,18 +7,29 @@ import os
 from unittest.mock import Mock, patch
 
 import pygame
+import pytest
 
 # Set up headless environment for tests
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 
 from src.config.constants import COLOR_PLACEHOLDER
 from src.utils.sprite_loader import (
+    clear_sprite_cache,
     load_character_animations,
+    load_characters_from_atlas,
     load_image,
     load_sprite_sheet,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_sprite_cache():
+    """Reset the missing-asset cache so tests don't see each other's paths."""
+    clear_sprite_cache()
+    yield
+    clear_sprite_cache()
+
+
 class TestLoadImage:
     """Tests for the load_image function."""
 
@@ -61,15 +72,16 @@ class TestLoadImage:
 
     @patch("src.utils.sprite_loader.os.path.exists")
     @patch("src.utils.sprite_loader.pygame.image.load")
-    @patch("src.utils.sprite_loader.pygame.transform.scale")
+    @patch("src.utils.sprite_loader.pygame.transform.smoothscale")
     def test_load_image_with_scale(self, mock_scale, mock_load, mock_exists):
-        """load_image should scale image when scale parameter provided."""
+        """load_image should scale before converting so conversion is cheaper."""
         # Arrange
         mock_exists.return_value = True
         mock_surface = Mock()
-        mock_surface.convert_alpha.return_value = mock_surface
+        mock_surface.get_bitsize.return_value = 32
         mock_load.return_value = mock_surface
-        mock_scaled = Mock(spec=pygame.Surface)
+        mock_scaled = Mock()
+        mock_scaled.convert_alpha.return_value = mock_scaled
         mock_scale.return_value = mock_scaled
 
         # Act
@@ -77,8 +89,53 @@ class TestLoadImage:
 
         # Assert
         mock_scale.assert_called_once_with(mock_surface, (100, 100))
+        mock_surface.convert_alpha.assert_not_called()
         assert result == mock_scaled
 
+    @patch("src.utils.sprite_loader.os.path.exists")
+    @patch("src.utils.sprite_loader.pygame.image.load")
+    @patch("src.utils.sprite_loader.pygame.transform.smoothscale")
+    def test_load_image_scales_paletted_after_convert(
+        self, mock_scale, mock_load, mock_exists
+    ):
+        """load_image should promote paletted surfaces before smoothscale."""
+        # Arrange
+        mock_exists.return_value = True
+        mock_surface = Mock()
+        mock_surface.get_bitsize.return_value = 8
+        mock_converted = Mock()
+        mock_surface.convert_alpha.return_value = mock_converted
+        mock_load.return_value = mock_surface
+        mock_scaled = Mock()
+        mock_scaled.convert_alpha.return_value = mock_scaled
+        mock_scale.return_value = mock_scaled
+
+        # Act
+        result = load_image("test.png", scale=(100, 100))
+
+        # Assert
+        mock_scale.assert_called_once_with(mock_converted, (100, 100))
+        assert result == mock_scaled
+
+    @patch("src.utils.sprite_loader.os.path.exists")
+    @patch("src.utils.sprite_loader.pygame.Surface")
+    def test_missing_image_path_is_cached(self, mock_surface_class, mock_exists):
+        """load_image should not re-check the filesystem for a known-missing path."""
+        # Arrange
+        mock_exists.return_value = False
+        mock_placeholder = Mock()
+        mock_surface_class.return_value = mock_placeholder
+
+        # Act
+        first = load_image("missing.png")
+        second = load_image("missing.png")
+
+        # Assert
+        mock_exists.assert_called_once_with("missing.png")
+        mock_surface_class.assert_called_once_with((64, 64))
+        assert first == mock_placeholder
+        assert second == mock_placeholder
+
     @patch("src.utils.sprite_loader.os.path.exists")
     @patch("src.utils.sprite_loader.pygame.image.load")
     @patch("src.utils.sprite_loader.pygame.Surface")
@@ -100,6 +157,78 @@ class TestLoadImage:
         assert result == mock_placeholder
 
 
+class TestLoadCharactersFromAtlas:
+    """Tests for the load_characters_from_atlas function."""
+
+    @patch("src.utils.sprite_loader.os.path.exists")
+    def test_missing_atlas_returns_empty(self, mock_exists):
+        """load_characters_from_atlas should return empty dict for missing files."""
+        # Arrange
+        mock_exists.return_value = False
+
+        # Act
+        result = load_characters_from_atlas("missing.png", "missing.json")
+
+        # Assert
+        assert result == {}
+
+    @patch("src.utils.sprite_loader.os.path.exists")
+    @patch("src.utils.sprite_loader.pygame.image.load")
+    @patch(
+        "builtins.open",
+        new_callable=Mock,
+    )
+    @patch("src.utils.sprite_loader.json.load")
+    def test_loads_atlas_once_and_subsurfaces_frames(
+        self, mock_json_load, mock_open, mock_load, mock_exists
+    ):
+        """load_characters_from_atlas should load one sheet and subsurface each frame."""
+        # Arrange
+        mock_exists.return_value = True
+        mock_open.return_value.__enter__ = Mock()
+        mock_open.return_value.__exit__ = Mock(return_value=False)
+        mock_json_load.return_value = {
+            "danger": {"walking": [[0, 0, 64, 64], [64, 0, 64, 64]]},
+            "rose": {"idle": [[0, 64, 64, 64]]},
+        }
+
+        mock_atlas = Mock()
+        mock_atlas.convert_alpha.return_value = mock_atlas
+        mock_frames = [Mock(), Mock(), Mock()]
+        mock_atlas.subsurface.side_effect = mock_frames
+        mock_load.return_value = mock_atlas
+
+        # Act
+        result = load_characters_from_atlas("atlas.png", "atlas.json")
+
+        # Assert
+        mock_load.assert_called_once_with("atlas.png")
+        assert len(result["danger"]["walking"]) == 2
+        assert len(result["rose"]["idle"]) == 1
+        assert mock_atlas.subsurface.call_count == 3
+
+    @patch("src.utils.sprite_loader.os.path.exists")
+    @patch("src.utils.sprite_loader.pygame.image.load")
+    @patch("builtins.open", new_callable=Mock)
+    @patch("src.utils.sprite_loader.json.load")
+    def test_atlas_load_error_returns_empty(
+        self, mock_json_load, mock_open, mock_load, mock_exists
+    ):
+        """load_characters_from_atlas should return empty dict on pygame error."""
+        # Arrange
+        mock_exists.return_value = True
+        mock_open.return_value.__enter__ = Mock()
+        mock_open.return_value.__exit__ = Mock(return_value=False)
+        mock_json_load.return_value = {}
+        mock_load.side_effect = pygame.error("Loading failed")
+
+        # Act
+        result = load_characters_from_atlas("atlas.png", "atlas.json")
+
+        # Assert
+        assert result == {}
+
+
 class TestLoadSpriteSheet:
     """Tests for the load_sprite_sheet function."""
 
@@ -3,7 +3,7 @@
 import pygame
 import pytest
 
-from src.entities.vegas_boss import BossPhase, Projectile, VegasBoss
+from src.entities.vegas_boss import BossPhase, Particle, Projectile, VegasBoss
 
 
 class TestVegasBossAdditional:
@@ -51,14 +51,14 @@ class TestVegasBossAdditional:
         # Add some particles
         for i in range(5):
             boss.particles.append(
-                {
-                    "x": 100,
-                    "y": 100,
-                    "vx": 10,
-                    "vy": -10,
-                    "lifetime": i * 0.3,
-                    "color": (255, 0, 0),
-                }
+                Particle(
+                    x=100,
+                    y=100,
+                    vx=10,
+                    vy=-10,
+                    lifetime=i * 0.3,
+                    color=(255, 0, 0),
+                )
             )
 
         # Update to clean old particles
@@ -12,22 +12,206 @@ This tool validates audio assets and detects common audio bugs:
 
 import json
 import os
+import struct
 import sys
 import wave
-from dataclasses import asdict, dataclass
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# pygame and mutagen are imported lazily inside the methods that need them,
+# so importing this module (e.g. for --help) doesn't pay their startup cost.
 
-import pygame
-from mutagen.mp3 import MP3
-from mutagen.oggvorbis import OggVorbis
+# Optional: real waveform analysis needs numpy + soundfile; without them the
+# quality helpers fall back to their previous simplified estimates
+try:
+    import numpy as np
+    import soundfile as sf
+except ImportError:
+    np = None
+    sf = None
+
+# Optional: C-level JSON serializer for large reports
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set dummy audio driver for headless testing
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
+# Metadata extracted from one mutagen/wave open of a file
+Probe = namedtuple("Probe", "ok error length bitrate")
+
+# Sample-level metrics computed from one decode of a file
+Analysis = namedtuple("Analysis", "peak rms silence_ratio")
+
+# Expected-file spec as an attribute-access record; the table never mutates
+# after __init__, so the validation loop reads spec.min_duration instead of
+# doing per-file "key in dict" membership tests
+Spec = namedtuple(
+    "Spec",
+    "min_duration max_duration min_volume loops",
+    defaults=(None, None, None, False),
+)
+
+
+@lru_cache(maxsize=256)
+def _analyze_samples(path_str: str) -> Analysis | None:
+    """Decode a file once and compute peak, RMS and silence ratio.
+
+    All three metrics come from the same decode as vectorized NumPy
+    reductions, so clipping, volume and silence checks share one pass.
+    The file is streamed in 64K-frame blocks and reduced with running
+    totals, so memory stays O(blocksize) even for long music tracks.
+    Returns None when soundfile/numpy are unavailable or decode fails.
+    """
+    if sf is None:
+        return None
+
+    peak = 0.0
+    sum_squares = 0.0
+    silence_samples = 0
+    total_samples = 0
+    silence_threshold = 0.01 * 32768
+
+    try:
+        for block in sf.blocks(
+            path_str, blocksize=1 << 16, dtype="int16", always_2d=True
+        ):
+            mono = block.mean(axis=1)
+            abs_mono = np.abs(mono)
+            peak = max(peak, float(abs_mono.max()))
+            sum_squares += float((mono.astype(np.float32) ** 2).sum())
+            silence_samples += int((abs_mono < silence_threshold).sum())
+            total_samples += mono.size
+    except Exception:
+        return None
+
+    if total_samples == 0:
+        return Analysis(0.0, 0.0, 1.0)
+
+    rms = (sum_squares / total_samples) ** 0.5 / 32768.0
+    return Analysis(peak / 32768.0, rms, silence_samples / total_samples)
+
+
+# Probe results persisted between runs, keyed by absolute path with the
+# file's (size, mtime) recorded so stale entries are ignored
+_probe_cache: dict[str, dict] = {}
+
+
+def _load_probe_cache(cache_path: Path) -> None:
+    """Load probe results persisted by a previous run."""
+    try:
+        with open(cache_path) as f:
+            _probe_cache.update(json.load(f))
+    except (OSError, json.JSONDecodeError):
+        pass
+
+
+def _save_probe_cache(cache_path: Path) -> None:
+    """Persist probe results so unchanged files skip mutagen next run."""
+    try:
+        with open(cache_path, "w") as f:
+            json.dump(_probe_cache, f)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=256)
+def _probe(path_str: str) -> Probe:
+    """Parse a file's audio headers once and cache the result.
+
+    Integrity, duration and bitrate checks all read from this single probe
+    instead of re-opening the file with mutagen for each question. Files
+    unchanged since the last run (same size and mtime) are answered from
+    the persisted cache with just a stat.
+    """
+    try:
+        st = Path(path_str).stat()
+    except OSError:
+        st = None
+
+    key = str(Path(path_str).resolve())
+    if st is not None:
+        cached = _probe_cache.get(key)
+        if cached and cached["size"] == st.st_size and cached["mtime"] == st.st_mtime:
+            return Probe(
+                cached["ok"], cached["error"], cached["length"], cached["bitrate"]
+            )
+
+    probe = _parse_headers(path_str)
+
+    if st is not None:
+        _probe_cache[key] = {
+            "size": st.st_size,
+            "mtime": st.st_mtime,
+            **probe._asdict(),
+        }
+    return probe
+
+
+def _parse_headers(path_str: str) -> Probe:
+    """Read a file's audio headers with mutagen/wave."""
+    from mutagen.mp3 import MP3
+    from mutagen.oggvorbis import OggVorbis
+
+    try:
+        suffix = Path(path_str).suffix.lower()
+        if suffix == ".ogg":
+            info = OggVorbis(path_str).info
+            return Probe(info.length > 0, None, info.length, info.bitrate)
+        if suffix == ".mp3":
+            from mutagen.mp3 import BitrateMode
+
+            info = MP3(path_str).info
+            length = info.length
+            if not length and getattr(info, "bitrate_mode", None) == BitrateMode.CBR:
+                # CBR without a Xing header: duration follows directly from
+                # file size and the frame-header bitrate, no VBR scan needed
+                if info.bitrate:
+                    length = os.path.getsize(path_str) * 8 / info.bitrate
+            return Probe(length > 0, None, length, info.bitrate)
+        if suffix == ".wav":
+            # Canonical 44-byte RIFF header: one small read gives byte rate
+            # and data size without wave.open parsing the whole chunk chain
+            with open(path_str, "rb") as f:
+                hdr = f.read(44)
+            if (
+                len(hdr) == 44
+                and hdr[:4] == b"RIFF"
+                and hdr[8:12] == b"WAVE"
+                and hdr[36:40] == b"data"
+            ):
+                byte_rate = struct.unpack("<I", hdr[28:32])[0]
+                data_sz = struct.unpack("<I", hdr[40:44])[0]
+                if byte_rate:
+                    return Probe(data_sz > 0, None, data_sz / byte_rate, None)
+            # Non-canonical chunk layout: fall back to the full parser
+            with wave.open(path_str, "rb") as wav:
+                frames = wav.getnframes()
+                length = frames / float(wav.getframerate())
+                return Probe(frames > 0, None, length, None)
+    except Exception as e:
+        return Probe(False, str(e), None, None)
+    # Unknown suffix: nothing to parse, treat as intact
+    return Probe(True, None, None, None)
+
+
+def _quality_probe_path(path_str: str) -> dict[str, any]:
+    """Gather raw quality data for one file.
+
+    Module-level and picklable so it can run in worker processes when the
+    NumPy analysis path makes the work CPU-bound.
+    """
+    return {
+        "bitrate": _probe(path_str).bitrate,
+        "analysis": _analyze_samples(path_str),
+    }
+
 
 @dataclass
 class AudioIssue:
@@ -39,6 +223,16 @@ class AudioIssue:
     severity: str = "medium"
     details: dict | None = None
 
+    def _to_dict(self) -> dict:
+        """Flat dict of fields; avoids dataclasses.asdict's deepcopy walk."""
+        return {
+            "file_path": self.file_path,
+            "issue_type": self.issue_type,
+            "description": self.description,
+            "severity": self.severity,
+            "details": self.details,
+        }
+
 
 @dataclass
 class AudioPlaybackTest:
@@ -61,6 +255,9 @@ class AudioValidator:
         self.results_dir = Path("audio_test_results")
         self.results_dir.mkdir(exist_ok=True)
 
+        self._probe_cache_path = self.results_dir / "probe_cache.json"
+        _load_probe_cache(self._probe_cache_path)
+
         self.issues: list[AudioIssue] = []
         self.playback_tests: list[AudioPlaybackTest] = []
 
@@ -95,6 +292,20 @@ class AudioValidator:
             },
         }
 
+        # Flat filename -> spec index so per-file lookups are O(1)
+        self._specs_index = {
+            fname: spec
+            for files in self.expected_audio.values()
+            for fname, spec in files.items()
+        }
+
+        # Frozen flat view of the expected table for tight iteration
+        self._expected = tuple(
+            (category, filename, Spec(**specs))
+            for category, files in self.expected_audio.items()
+            for filename, specs in files.items()
+        )
+
         # Audio quality thresholds
         self.quality_thresholds = {
             "min_bitrate": 128000,  # 128 kbps
@@ -105,10 +316,15 @@ class AudioValidator:
 
     def run_validation(self) -> dict[str, any]:
         """Run complete audio validation suite."""
+        import pygame
+
         print("🔊 Starting audio validation...")
 
         # Initialize pygame mixer
         pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        # Allocate the channel pool up front so sound.play() never grows it
+        pygame.mixer.set_num_channels(16)
+        pygame.mixer.set_reserved(4)
 
         # Run validation tests
         test_results = {
@@ -120,6 +336,9 @@ class AudioValidator:
 
         pygame.mixer.quit()
 
+        # Persist probe results for the next run
+        _save_probe_cache(self._probe_cache_path)
+
         # Generate report
         return self._generate_report(test_results)
 
@@ -135,62 +354,147 @@ class AudioValidator:
             "wrong_format": [],
         }
 
+        # Accumulate issues locally and extend once at the end
+        new_issues = []
+        append_issue = new_issues.append
+
+        # Probing is I/O bound (stat + mutagen header reads), so fan the
+        # per-file work out to threads and keep issue appends on this thread.
+        # One directory read per category replaces a stat per expected file;
+        # None marks a category whose directory is absent entirely
+        present_by_category: dict[str, set[str] | None] = {}
         for category, files in self.expected_audio.items():
             category_dir = self.audio_dir / category
+            if category_dir.is_dir():
+                present_by_category[category] = {
+                    entry.name for entry in os.scandir(category_dir)
+                }
+            else:
+                # Whole directory absent (common during CI setup): record one
+                # issue and the misses without probing each expected file
+                present_by_category[category] = None
+                results["total_expected"] += len(files)
+                results["missing"].extend(str(category_dir / f) for f in files)
+                append_issue(
+                    AudioIssue(
+                        file_path=str(category_dir),
+                        issue_type="missing_category_dir",
+                        description=f"Audio category directory not found: {category}",
+                        severity="high",
+                    )
+                )
+
+        jobs = [
+            (
+                filename,
+                specs,
+                self.audio_dir / category / filename,
+                filename in present_by_category[category],
+            )
+            for category, filename, specs in self._expected
+            if present_by_category[category] is not None
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
+        ) as executor:
+            probes = list(
+                executor.map(lambda job: self._probe_file(job[2], job[3]), jobs)
+            )
 
-            for filename, specs in files.items():
-                results["total_expected"] += 1
-                file_path = category_dir / filename
+        for (filename, specs, file_path, _), probe in zip(jobs, probes, strict=True):
+            results["total_expected"] += 1
+            path_str = str(file_path)
+
+            if not probe["exists"]:
+                results["missing"].append(path_str)
+                append_issue(
+                    AudioIssue(
+                        file_path=path_str,
+                        issue_type="missing_file",
+                        description=f"Required audio file not found: {filename}",
+                        severity="high",
+                    )
+                )
+                continue
 
-                if not file_path.exists():
-                    results["missing"].append(str(file_path))
-                    self.issues.append(
+            # Validate file format
+            if not probe["format_ok"]:
+                results["wrong_format"].append(path_str)
+                continue
+
+            # Check if file is corrupted
+            if not probe["integrity_ok"]:
+                if probe["integrity_error"]:
+                    append_issue(
                         AudioIssue(
-                            file_path=str(file_path),
-                            issue_type="missing_file",
-                            description=f"Required audio file not found: {filename}",
+                            file_path=path_str,
+                            issue_type="corrupted_file",
+                            description=f"File appears to be corrupted: {probe['integrity_error']}",
                             severity="high",
                         )
                     )
-                    continue
-
-                # Validate file format
-                if not self._validate_file_format(file_path):
-                    results["wrong_format"].append(str(file_path))
-                    continue
-
-                # Check if file is corrupted
-                if not self._validate_file_integrity(file_path):
-                    results["corrupted"].append(str(file_path))
-                    continue
+                results["corrupted"].append(path_str)
+                continue
 
-                results["found"] += 1
+            results["found"] += 1
 
-                # Validate duration if specified
-                duration = self._get_audio_duration(file_path)
-                if duration:
-                    if "min_duration" in specs and duration < specs["min_duration"]:
-                        self.issues.append(
-                            AudioIssue(
-                                file_path=str(file_path),
-                                issue_type="duration_too_short",
-                                description=f"Audio duration {duration:.1f}s is less than required {specs['min_duration']}s",
-                                severity="medium",
-                            )
+            # Validate duration if specified
+            duration = probe["duration"]
+            if duration:
+                if specs.min_duration is not None and duration < specs.min_duration:
+                    append_issue(
+                        AudioIssue(
+                            file_path=path_str,
+                            issue_type="duration_too_short",
+                            description=f"Audio duration {duration:.1f}s is less than required {specs.min_duration}s",
+                            severity="medium",
                         )
+                    )
 
-                    if "max_duration" in specs and duration > specs["max_duration"]:
-                        self.issues.append(
-                            AudioIssue(
-                                file_path=str(file_path),
-                                issue_type="duration_too_long",
-                                description=f"Audio duration {duration:.1f}s exceeds maximum {specs['max_duration']}s",
-                                severity="low",
-                            )
+                if specs.max_duration is not None and duration > specs.max_duration:
+                    append_issue(
+                        AudioIssue(
+                            file_path=path_str,
+                            issue_type="duration_too_long",
+                            description=f"Audio duration {duration:.1f}s exceeds maximum {specs.max_duration}s",
+                            severity="low",
                         )
+                    )
 
+        self.issues.extend(new_issues)
         return results
 
+    def _probe_file(self, file_path: Path, exists: bool) -> dict[str, any]:
+        """Probe one audio file in a single pass.
+
+        Thread-safe: collects everything the caller needs (format, integrity,
+        duration) without touching self.issues, so it can run in a worker
+        thread. Existence comes from the caller's directory index, so no
+        per-file stat happens here.
+        """
+        probe = {
+            "exists": exists,
+            "format_ok": False,
+            "integrity_ok": False,
+            "integrity_error": None,
+            "duration": None,
+        }
+
+        if not exists:
+            return probe
+
+        if not self._validate_file_format(file_path):
+            return probe
+        probe["format_ok"] = True
+
+        parsed = _probe(str(file_path))
+        probe["integrity_ok"] = parsed.ok
+        probe["integrity_error"] = parsed.error
+        probe["duration"] = parsed.length
+
+        return probe
+
     def _check_audio_quality(self) -> dict[str, any]:
         """Check audio quality metrics."""
         print("\n🎵 Checking audio quality...")
@@ -202,26 +506,54 @@ class AudioValidator:
             "format_issues": [],
         }
 
+        # Accumulate issues locally and extend once at the end
+        new_issues = []
+        append_issue = new_issues.append
+
         for category in ["music", "sfx"]:
             category_dir = self.audio_dir / category
-            if not category_dir.exists():
+            if not category_dir.is_dir():
                 continue
 
-            for audio_file in category_dir.glob("*.ogg"):
+            # Single scandir pass instead of a glob walk
+            audio_files = sorted(
+                category_dir / entry.name
+                for entry in os.scandir(category_dir)
+                if entry.name.endswith(".ogg")
+            )
+
+            # With soundfile available the decode + NumPy reductions are
+            # CPU-bound, so use processes to sidestep the GIL; otherwise the
+            # work is header reads and threads suffice. Issue bookkeeping
+            # stays single-threaded afterwards either way.
+            if sf is not None:
+                executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4)
+                )
+            with executor:
+                raw_metrics = list(
+                    executor.map(_quality_probe_path, (str(p) for p in audio_files))
+                )
+            metrics = [self._interpret_metrics(raw) for raw in raw_metrics]
+
+            for audio_file, file_metrics in zip(audio_files, metrics, strict=True):
                 results["files_checked"] += 1
+                path_str = str(audio_file)
 
                 # Check bitrate
-                bitrate = self._get_bitrate(audio_file)
+                bitrate = file_metrics["bitrate"]
                 if bitrate and bitrate < self.quality_thresholds["min_bitrate"]:
                     results["quality_issues"].append(
                         {
-                            "file": str(audio_file),
+                            "file": path_str,
                             "issue": f"Low bitrate: {bitrate / 1000:.0f} kbps",
                         }
                     )
-                    self.issues.append(
+                    append_issue(
                         AudioIssue(
-                            file_path=str(audio_file),
+                            file_path=path_str,
                             issue_type="low_bitrate",
                             description=f"Bitrate {bitrate / 1000:.0f} kbps is below recommended {self.quality_thresholds['min_bitrate'] / 1000:.0f} kbps",
                             severity="low",
@@ -229,13 +561,13 @@ class AudioValidator:
                     )
 
                 # Check for clipping
-                if self._check_clipping(audio_file):
+                if file_metrics["clipping"]:
                     results["quality_issues"].append(
-                        {"file": str(audio_file), "issue": "Audio clipping detected"}
+                        {"file": path_str, "issue": "Audio clipping detected"}
                     )
-                    self.issues.append(
+                    append_issue(
                         AudioIssue(
-                            file_path=str(audio_file),
+                            file_path=path_str,
                             issue_type="clipping",
                             description="Audio clipping detected - may cause distortion",
                             severity="medium",
@@ -243,20 +575,20 @@ class AudioValidator:
                     )
 
                 # Check volume levels
-                avg_volume = self._get_average_volume(audio_file)
+                avg_volume = file_metrics["avg_volume"]
                 if avg_volume:
                     expected_specs = self._get_expected_specs(audio_file.name)
                     if expected_specs and "min_volume" in expected_specs:
                         if avg_volume < expected_specs["min_volume"] * 0.5:
                             results["volume_issues"].append(
                                 {
-                                    "file": str(audio_file),
+                                    "file": path_str,
                                     "issue": f"Volume too low: {avg_volume:.2f}",
                                 }
                             )
-                            self.issues.append(
+                            append_issue(
                                 AudioIssue(
-                                    file_path=str(audio_file),
+                                    file_path=path_str,
                                     issue_type="low_volume",
                                     description=f"Average volume {avg_volume:.2f} is too low",
                                     severity="medium",
@@ -264,19 +596,40 @@ class AudioValidator:
                             )
 
                 # Check for excessive silence
-                silence_ratio = self._check_silence_ratio(audio_file)
+                silence_ratio = file_metrics["silence_ratio"]
                 if silence_ratio > self.quality_thresholds["max_silence_ratio"]:
                     results["quality_issues"].append(
                         {
-                            "file": str(audio_file),
+                            "file": path_str,
                             "issue": f"Excessive silence: {silence_ratio * 100:.0f}%",
                         }
                     )
 
+        self.issues.extend(new_issues)
         return results
 
+    def _interpret_metrics(self, raw: dict[str, any]) -> dict[str, any]:
+        """Turn a worker's raw probe + analysis into threshold decisions."""
+        analysis = raw["analysis"]
+        if analysis is None:
+            # Decode unavailable - keep the prior simplified estimates
+            return {
+                "bitrate": raw["bitrate"],
+                "clipping": False,
+                "avg_volume": 0.7,
+                "silence_ratio": 0.05,
+            }
+        return {
+            "bitrate": raw["bitrate"],
+            "clipping": analysis.peak > self.quality_thresholds["clipping_threshold"],
+            "avg_volume": analysis.rms,
+            "silence_ratio": analysis.silence_ratio,
+        }
+
     def _test_audio_playback(self) -> dict[str, any]:
         """Test audio playback functionality."""
+        import pygame
+
         print("\n▶️  Testing audio playback...")
 
         results = {
@@ -306,7 +659,7 @@ class AudioValidator:
                     pygame.mixer.music.play(-1)  # Loop
 
                     # Check if playing
-                    pygame.time.wait(100)  # Wait for playback to start
+                    pygame.time.wait(20)  # Dummy driver stabilizes immediately
                     if not pygame.mixer.music.get_busy():
                         results["playback_errors"].append(
                             {"scene": scene, "issue": "Music failed to start playing"}
@@ -441,86 +794,55 @@ class AudioValidator:
 
     def _validate_file_integrity(self, file_path: Path) -> bool:
         """Check if audio file is corrupted."""
-        try:
-            if file_path.suffix.lower() == ".ogg":
-                audio = OggVorbis(str(file_path))
-                return audio.info.length > 0
-            if file_path.suffix.lower() == ".mp3":
-                audio = MP3(str(file_path))
-                return audio.info.length > 0
-            if file_path.suffix.lower() == ".wav":
-                with wave.open(str(file_path), "rb") as wav:
-                    return wav.getnframes() > 0
-        except Exception as e:
+        probe = _probe(str(file_path))
+        if probe.error:
             self.issues.append(
                 AudioIssue(
                     file_path=str(file_path),
                     issue_type="corrupted_file",
-                    description=f"File appears to be corrupted: {str(e)}",
+                    description=f"File appears to be corrupted: {probe.error}",
                     severity="high",
                 )
             )
-            return False
-        return True
+        return probe.ok
 
     def _get_audio_duration(self, file_path: Path) -> float | None:
         """Get audio file duration in seconds."""
-        try:
-            if file_path.suffix.lower() == ".ogg":
-                audio = OggVorbis(str(file_path))
-                return audio.info.length
-            if file_path.suffix.lower() == ".mp3":
-                audio = MP3(str(file_path))
-                return audio.info.length
-            if file_path.suffix.lower() == ".wav":
-                with wave.open(str(file_path), "rb") as wav:
-                    frames = wav.getnframes()
-                    rate = wav.getframerate()
-                    return frames / float(rate)
-        except Exception:
-            return None
+        return _probe(str(file_path)).length
 
     def _get_bitrate(self, file_path: Path) -> int | None:
         """Get audio file bitrate."""
-        try:
-            if file_path.suffix.lower() == ".ogg":
-                audio = OggVorbis(str(file_path))
-                return audio.info.bitrate
-            if file_path.suffix.lower() == ".mp3":
-                audio = MP3(str(file_path))
-                return audio.info.bitrate
-        except Exception:
-            return None
+        return _probe(str(file_path)).bitrate
 
     def _check_clipping(self, file_path: Path) -> bool:
-        """Check if audio has clipping."""
-        # Simplified check - in production would analyze waveform
-        try:
-            # Load audio and check peak levels
-            pygame.mixer.Sound(str(file_path))
-            # This is a placeholder - real implementation would analyze samples
-            return False
-        except Exception:
+        """Check if audio has clipping.
+
+        Reads the cached sample analysis; never decodes through the pygame
+        mixer, which used to load the whole file into SDL just to discard it.
+        """
+        analysis = _analyze_samples(str(file_path))
+        if analysis is None:
             return False
+        return analysis.peak > self.quality_thresholds["clipping_threshold"]
 
     def _get_average_volume(self, file_path: Path) -> float | None:
         """Get average volume level (0.0 to 1.0)."""
-        # Simplified - returns a mock value
-        # Real implementation would analyze audio samples
-        return 0.7
+        analysis = _analyze_samples(str(file_path))
+        if analysis is None:
+            # Decode unavailable - assume a reasonable level
+            return 0.7
+        return analysis.rms
 
     def _check_silence_ratio(self, file_path: Path) -> float:
         """Check ratio of silence in audio file."""
-        # Simplified - returns a mock value
-        # Real implementation would analyze audio samples
-        return 0.05
+        analysis = _analyze_samples(str(file_path))
+        if analysis is None:
+            return 0.05
+        return analysis.silence_ratio
 
     def _get_expected_specs(self, filename: str) -> dict | None:
         """Get expected specifications for an audio file."""
-        for category, files in self.expected_audio.items():
-            if filename in files:
-                return files[filename]
-        return None
+        return self._specs_index.get(filename)
 
     def _generate_report(self, test_results: dict[str, any]) -> dict[str, any]:
         """Generate audio validation report."""
@@ -530,7 +852,6 @@ class AudioValidator:
             "critical_issues": len([i for i in self.issues if i.severity == "high"]),
             "test_results": test_results,
             "issues_by_type": self._categorize_issues(),
-            "issues_detail": [asdict(issue) for issue in self.issues],
         }
 
         # Save report
@@ -538,14 +859,41 @@ class AudioValidator:
             self.results_dir
             / f"audio_validation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         )
-        with open(report_path, "w") as f:
-            json.dump(report, f, indent=2)
+        self._write_report(report_path, report)
 
         # Print summary
         self._print_summary(report)
 
         return report
 
+    def _write_report(self, report_path: Path, report: dict[str, any]) -> None:
+        """Stream the report to disk, one issue at a time.
+
+        The report shell is written first and issues_detail is appended
+        incrementally, so peak memory stays at one issue dict instead of a
+        second full copy of the issue list on large runs.
+        """
+        if orjson is not None:
+
+            def dumps(obj):
+                return orjson.dumps(obj).decode()
+        else:
+            dumps = json.dumps
+
+        with open(report_path, "w") as f:
+            f.write("{")
+            for key, value in report.items():
+                f.write(dumps(key))
+                f.write(": ")
+                f.write(dumps(value))
+                f.write(", ")
+            f.write('"issues_detail": [')
+            for i, issue in enumerate(self.issues):
+                if i:
+                    f.write(", ")
+                f.write(dumps(issue._to_dict()))
+            f.write("]}")
+
     def _categorize_issues(self) -> dict[str, int]:
         """Categorize issues by type."""
         categories = {}
@@ -10,12 +10,16 @@ This tool runs the game in headless mode and automatically detects:
 - UI element positioning issues
 """
 
+from __future__ import annotations
+
 import json
 import os
+import queue
 import sys
+import threading
 import time
 import traceback
-from collections import defaultdict
+from collections import Counter
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
@@ -23,13 +27,49 @@ from typing import Any
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-import numpy as np
-import pygame
+# orjson is optional; serialization falls back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set headless mode before importing game modules
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
+# numpy, pygame and the optional fused kernel are imported on first use so
+# that `--help` and test collection never pay their import cost.
+np = None
+pygame = None
+_fused_analyze_frame = None
+_count_dark_reaches = None
+
+
+def _load_runtime_deps() -> None:
+    """Import the heavy runtime dependencies on first use."""
+    global np, pygame, _fused_analyze_frame, _count_dark_reaches
+    if pygame is not None:
+        return
+
+    import numpy
+    import pygame as pygame_module
+
+    np = numpy
+    pygame = pygame_module
+
+    # Optional fused analysis kernels; fall back to plain NumPy when numba
+    # is not installed.
+    try:
+        from tools._frame_analysis_numba import analyze_frame, count_dark_reaches
+    except ImportError:
+        try:
+            from _frame_analysis_numba import analyze_frame, count_dark_reaches
+        except ImportError:
+            analyze_frame = None
+            count_dark_reaches = None
+    _fused_analyze_frame = analyze_frame
+    _count_dark_reaches = count_dark_reaches
+
 
 @dataclass
 class VisualBug:
@@ -76,7 +116,10 @@ class CrashReport:
     scene: str
     exception_type: str
     message: str
-    traceback: str
+    # Held as a traceback.TracebackException during the run and rendered
+    # to a string at report time - formatting every stack line is too
+    # expensive for the main loop's except blocks.
+    traceback: Any
     severity: str = "high"
 
 
@@ -84,11 +127,16 @@ class AutomatedGameTester:
     """Automated testing system for Danger Rose game."""
 
     def __init__(self, output_dir: str = "test_results"):
+        _load_runtime_deps()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
         # Test results
         self.visual_bugs: list[VisualBug] = []
+        # Raw (timestamp, scene, bug_type, description, location, severity)
+        # tuples; turned into VisualBug dataclasses at report time so the
+        # per-frame path only appends tuples.
+        self._pending_visual: list[tuple] = []
         self.audio_bugs: list[AudioBug] = []
         self.performance_issues: list[PerformanceIssue] = []
         self.crashes: list[CrashReport] = []
@@ -98,21 +146,86 @@ class AutomatedGameTester:
         self.start_time = time.time()
         self.frame_count = 0
         self.last_fps_check = time.time()
-        self.fps_samples = []
+        # Fixed-size FPS sample buffer: O(1) memory for any test duration
+        # and a single SIMD mean at report time
+        self._fps_buf = np.empty(4096, np.float32)
+        self._fps_n = 0
+        self._frames_at_last_check = 0
+        self._fps_baseline = None
+        self._last_reference_t = 0.0
+        self._last_audio_check_t = 0.0
 
         # Screenshot comparison
         self.reference_screenshots = {}
         self.screenshot_dir = self.output_dir / "screenshots"
         self.screenshot_dir.mkdir(exist_ok=True)
 
+        # Perceptual-hash cache: identical consecutive frames skip analysis
+        self._last_frame_hash = None
+        self._saved_reference_hashes = set()
+
+        # Screenshots are encoded on a background thread so PNG writes never
+        # block the test loop (and distort its own FPS measurements)
+        self._screenshot_q: queue.Queue = queue.Queue(maxsize=32)
+        self._screenshot_thread = threading.Thread(
+            target=self._screenshot_worker, daemon=True
+        )
+        self._screenshot_thread.start()
+
+        # Bugs are streamed to a JSONL sidecar as they occur, so a killed
+        # soak test still leaves partial results on disk. The handle has
+        # to outlive __init__ for that to work; the report path closes it.
+        self._bug_jsonl = open(  # noqa: SIM115
+            self.output_dir / f"bugs_{int(time.time())}.jsonl", "w"
+        )
+        self._bug_records_written = 0
+
         # Audio tracking
         self.audio_files_checked = set()
         self.missing_audio_files = set()
 
-        # Visual detection thresholds
-        self.black_screen_threshold = 0.95  # 95% black pixels = black screen
+        # Scratch buffer reused by every luminance reduction so steady-state
+        # frame analysis allocates nothing
+        self._luma_buf = None
+        # BT.601 luminance weights for the blackout metric
+        self._luma_weights = np.array([0.299, 0.587, 0.114])
+
+        # Visual detection thresholds (per 8x8-block mean luminance)
+        self.uniform_frame_threshold = 4.0  # Max luminance spread when blank
+        self.black_screen_luma = 10.0  # Max mean luminance of a black block
         self.missing_sprite_threshold = 0.8  # 80% transparent = missing sprite
 
+        # Probe coordinates shared by the fused and fallback analysis paths
+        self._door_probe_xy = np.array([[200, 300], [400, 300], [600, 300]], np.int64)
+        self._sprite_region_xy = np.array(
+            [[400, 300], [100, 100], [700, 100]], np.int64
+        )
+        self._sprite_region_half = 50
+
+        # The test sequence uses a closed set of keys, so build each event
+        # object once instead of allocating a fresh one per action
+        self._events = {
+            "RETURN": pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN),
+            "RIGHT": pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT),
+            "SPACE": pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE),
+            "ESCAPE": pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE),
+        }
+        # action -> (movement target or None, events to send)
+        self._action_table = {
+            "start": (None, (self._events["RETURN"],)),
+            "select_character": (
+                None,
+                (self._events["RIGHT"], self._events["RIGHT"]),
+            ),
+            "start_game": (None, (self._events["RETURN"],)),
+            "enter_ski": ((200, 300), (self._events["SPACE"],)),
+            "enter_pool": ((400, 300), (self._events["SPACE"],)),
+            "enter_vegas": ((600, 300), (self._events["SPACE"],)),
+            "return_to_hub": (None, (self._events["ESCAPE"],)),
+            "pause_game": (None, (self._events["ESCAPE"],)),
+            "resume_game": (None, (self._events["RETURN"],)),
+        }
+
     def run_automated_test(self, duration_seconds: int = 60) -> dict[str, Any]:
         """Run automated test for specified duration."""
         print(f"🤖 Starting automated game test for {duration_seconds} seconds...")
@@ -147,13 +260,27 @@ class AutomatedGameTester:
             sequence_timer = 0
             test_start = time.time()
 
+            # The dummy video driver produces no real events and the test
+            # sequence dispatches its synthesized events straight to
+            # scene_manager.handle_event, so the loop never needs to poll
+            # the SDL queue. Clear it once in case init left anything.
+            pygame.event.clear()
+
             # Main test loop
-            while time.time() - test_start < duration_seconds:
-                dt = clock.tick(60) / 1000.0
+            while True:
+                # One clock read per frame, shared by every consumer below
+                now = time.time()
+                if now - test_start >= duration_seconds:
+                    break
+                frame_t = now - self.start_time
+
+                # Uncapped: headless testing wants maximum frames per
+                # wall-second, not a 60 FPS sleep-limited loop
+                dt = clock.tick() / 1000.0
                 self.frame_count += 1
 
                 # Update FPS tracking
-                self._track_performance(dt)
+                self._track_performance(dt, now)
 
                 # Handle test sequence
                 if sequence_index < len(test_sequence):
@@ -165,12 +292,6 @@ class AutomatedGameTester:
                         sequence_index += 1
                         sequence_timer = 0
 
-                # Process game events
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        break
-                    scene_manager.handle_event(event)
-
                 # Update game
                 try:
                     scene_manager.update(dt)
@@ -184,19 +305,25 @@ class AutomatedGameTester:
                     pygame.display.flip()
 
                     # Analyze current frame
-                    self._analyze_frame(screen, scene_manager)
+                    self._analyze_frame(screen, scene_manager, frame_t)
 
                 except Exception as e:
                     self._record_crash(e, scene_manager)
 
-                # Check audio status periodically
-                if self.frame_count % 60 == 0:  # Once per second
-                    self._check_audio_status(scene_manager)
+                # Check audio status once per second of wall time; the
+                # uncapped loop runs far past 60 FPS, so a frame-count
+                # gate would fire many times a second
+                if frame_t - self._last_audio_check_t >= 1.0:
+                    self._last_audio_check_t = frame_t
+                    self._check_audio_status(scene_manager, frame_t)
 
         except Exception as e:
             self._record_crash(e, None)
 
         finally:
+            # Flush queued screenshots before tearing pygame down
+            self._screenshot_q.put(None)
+            self._screenshot_thread.join(timeout=10)
             pygame.quit()
 
         # Generate report
@@ -206,51 +333,13 @@ class AutomatedGameTester:
         """Perform a test action."""
         print(f"🎮 Performing action: {action}")
 
-        if action == "start":
-            # Simulate pressing start button
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)
-            scene_manager.handle_event(event)
-
-        elif action == "select_character":
-            # Simulate selecting Dad character
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)
-            scene_manager.handle_event(event)
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)
-            scene_manager.handle_event(event)
-
-        elif action == "start_game":
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)
-            scene_manager.handle_event(event)
-
-        elif action == "enter_ski":
-            # Move to ski door and enter
-            self._simulate_movement(scene_manager, target_x=200, target_y=300)
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
-            scene_manager.handle_event(event)
-
-        elif action == "enter_pool":
-            # Move to pool door and enter
-            self._simulate_movement(scene_manager, target_x=400, target_y=300)
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
-            scene_manager.handle_event(event)
-
-        elif action == "enter_vegas":
-            # Move to vegas door and enter
-            self._simulate_movement(scene_manager, target_x=600, target_y=300)
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
-            scene_manager.handle_event(event)
-
-        elif action == "return_to_hub":
-            # Press ESC to return
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
-            scene_manager.handle_event(event)
-
-        elif action == "pause_game":
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
-            scene_manager.handle_event(event)
-
-        elif action == "resume_game":
-            event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)
+        target, events = self._action_table[action]
+        if target is not None:
+            # Move to the matching door before entering
+            self._simulate_movement(
+                scene_manager, target_x=target[0], target_y=target[1]
+            )
+        for event in events:
             scene_manager.handle_event(event)
 
     def _simulate_movement(self, scene_manager, target_x: int, target_y: int) -> None:
@@ -259,7 +348,9 @@ class AutomatedGameTester:
         # and send appropriate movement events
         pass
 
-    def _analyze_frame(self, screen: pygame.Surface, scene_manager) -> None:
+    def _analyze_frame(
+        self, screen: pygame.Surface, scene_manager, frame_t: float
+    ) -> None:
         """Analyze current frame for visual issues."""
         # Get current scene name
         current_scene = self._get_scene_name(scene_manager)
@@ -267,124 +358,189 @@ class AutomatedGameTester:
             print(f"📍 Scene changed: {self.current_scene} -> {current_scene}")
             self.current_scene = current_scene
 
-        # Convert surface to numpy array for analysis
-        pixels = pygame.surfarray.array3d(screen)
+        # Skip the whole pixel pass when the frame is identical to the last
+        # one (idle title screen, pause menu) - the verdict cannot change.
+        frame_hash = self._frame_dhash(screen)
+        if frame_hash == self._last_frame_hash:
+            return
+        self._last_frame_hash = frame_hash
+
+        if _fused_analyze_frame is not None:
+            # Zero-copy view over the SDL surface; the fused kernel makes
+            # one streaming pass over the full frame, so no downsample is
+            # needed on this path.
+            pixels = pygame.surfarray.pixels3d(screen)
+            dark_thresh = int(pixels.shape[0] * pixels.shape[1] * 0.95)
+            if _count_dark_reaches(pixels, dark_thresh):
+                # Early-exit scan confirmed a >=95% near-black frame; every
+                # downstream predicate on such a frame is already decided,
+                # so skip the full kernel
+                del pixels
+                is_black = True
+                door_dark = (True,) * len(self._door_probe_xy)
+                transparent_regions = [
+                    (int(x), int(y)) for x, y in self._sprite_region_xy
+                ]
+            else:
+                block_min, block_max, door_dark, region_means = _fused_analyze_frame(
+                    pixels,
+                    self._door_probe_xy,
+                    self._sprite_region_xy,
+                    self._sprite_region_half,
+                )
+                # Unlock the surface before screenshots and display.flip()
+                del pixels
+                is_black = (
+                    block_max < self.black_screen_luma * 64
+                    or block_max - block_min < self.uniform_frame_threshold * 64
+                )
+                transparent_regions = [
+                    (int(x), int(y))
+                    for (x, y), mean in zip(
+                        self._sprite_region_xy, region_means, strict=True
+                    )
+                    if mean < 10.0
+                ]
+        else:
+            # Downsample once in SDL's optimized scaler and run every
+            # NumPy check on the 100x75 buffer - 64x less data per
+            # reduction, and black screens / missing sprites are
+            # low-frequency signals that survive the downscale.
+            small = pygame.transform.smoothscale(screen, (100, 75))
+            # SWAR fast path for true black: one uint32 compare per pixel
+            # tests the top four bits of all three channels at once,
+            # reading each pixel as a single packed integer
+            small_2d = pygame.surfarray.pixels2d(small)
+            all_dark = bool(np.all((small_2d & 0x00F0F0F0) == 0))
+            del small_2d
+            small_pixels = pygame.surfarray.pixels3d(small)
+            is_black = all_dark or self._is_black_screen(small_pixels)
+            transparent_regions = self._find_transparent_regions(small_pixels)
+            # One vectorized probe covers all doors, instead of a get_at
+            # per door (each locks the surface and allocates a Color)
+            door_dark = np.all(
+                small_pixels[
+                    self._door_probe_xy[:, 0] // 8,
+                    self._door_probe_xy[:, 1] // 8,
+                ]
+                == 0,
+                axis=1,
+            )
+            del small_pixels
 
         # Check for black screen
-        if self._is_black_screen(pixels):
-            self.visual_bugs.append(
-                VisualBug(
-                    timestamp=time.time() - self.start_time,
-                    scene=current_scene,
-                    bug_type="black_screen",
-                    description="Screen is completely or mostly black",
-                    severity="high",
-                )
+        if is_black:
+            self._record_visual(
+                frame_t,
+                current_scene,
+                "black_screen",
+                "Screen is black or uniformly blank",
+                severity="high",
             )
             self._save_screenshot(screen, f"black_screen_{current_scene}")
 
         # Check for missing sprites (large transparent areas)
-        transparent_regions = self._find_transparent_regions(screen)
         for region in transparent_regions:
-            self.visual_bugs.append(
-                VisualBug(
-                    timestamp=time.time() - self.start_time,
-                    scene=current_scene,
-                    bug_type="missing_sprite",
-                    description=f"Large transparent region detected at {region}",
-                    location=region,
-                    severity="medium",
-                )
+            self._record_visual(
+                frame_t,
+                current_scene,
+                "missing_sprite",
+                f"Large transparent region detected at {region}",
+                location=region,
             )
 
         # Check for UI element positioning
-        self._check_ui_elements(screen, current_scene)
-
-        # Take reference screenshot periodically
-        if self.frame_count % 300 == 0:  # Every 5 seconds at 60 FPS
+        self._check_ui_elements(current_scene, frame_t, door_dark)
+
+        # Take reference screenshot periodically, deduplicated by hash so
+        # visually identical frames are only written to disk once. The
+        # cadence is wall-clock based because the loop runs uncapped.
+        if (
+            frame_t - self._last_reference_t >= 5.0
+            and frame_hash not in self._saved_reference_hashes
+        ):
+            self._last_reference_t = frame_t
+            self._saved_reference_hashes.add(frame_hash)
             self._save_screenshot(
                 screen, f"reference_{current_scene}_{self.frame_count}"
             )
 
+    def _frame_dhash(self, screen: pygame.Surface) -> int:
+        """Compute a 64-bit difference hash of the rendered frame."""
+        small = pygame.transform.scale(screen, (9, 8))
+        gray = pygame.surfarray.array3d(small).mean(axis=2)
+        bits = gray[1:, :] > gray[:-1, :]
+        return int(np.packbits(bits).view(np.uint64)[0])
+
     def _is_black_screen(self, pixels: np.ndarray) -> bool:
-        """Check if screen is mostly black."""
-        # Count black or near-black pixels
-        black_pixels = np.sum(np.all(pixels < 10, axis=2))
-        total_pixels = pixels.shape[0] * pixels.shape[1]
-        black_ratio = black_pixels / total_pixels
-
-        return black_ratio > self.black_screen_threshold
-
-    def _find_transparent_regions(
-        self, screen: pygame.Surface
-    ) -> list[tuple[int, int]]:
-        """Find large transparent regions that might indicate missing sprites."""
-        # This is simplified - in a real implementation we'd use more sophisticated
-        # image processing to detect actual missing sprites vs intentional transparency
+        """Check if the frame is black or uniformly blank.
+
+        ``pixels`` is the 8x-downsampled frame, so each element already
+        aggregates an 8x8 block of the original image. Flag the frame when
+        every block is dark or when the luminance spread is near zero - a
+        uniform frame means nothing rendered at all.
+        """
+        if self._luma_buf is None or self._luma_buf.shape != pixels.shape[:2]:
+            self._luma_buf = np.empty(pixels.shape[:2])
+        luma = np.einsum("whc,c->wh", pixels, self._luma_weights, out=self._luma_buf)
+
+        if luma.max() < self.black_screen_luma:
+            return True  # Every block is near-black
+
+        return bool(np.ptp(luma) < self.uniform_frame_threshold)
+
+    def _find_transparent_regions(self, pixels: np.ndarray) -> list[tuple[int, int]]:
+        """Find large empty regions that might indicate missing sprites.
+
+        Display surfaces carry no alpha channel, so a region whose mean
+        channel value is near zero is the closest observable signal for a
+        sprite that failed to draw. ``pixels`` is the 8x-downsampled frame;
+        each region is a single sliced NumPy reduction over it.
+        """
         transparent_regions = []
+        half = max(1, self._sprite_region_half // 8)
 
-        # Check common sprite locations
-        sprite_locations = [
-            (400, 300),  # Center (player)
-            (100, 100),  # Top-left (UI)
-            (700, 100),  # Top-right (UI)
-        ]
-
-        for x, y in sprite_locations:
-            # Check a region around each location
-            region_size = 50
-            if self._is_region_transparent(
-                screen,
-                x - region_size,
-                y - region_size,
-                region_size * 2,
-                region_size * 2,
-            ):
-                transparent_regions.append((x, y))
+        # Check common sprite locations: center (player), top corners (UI).
+        # Bounds are clamped explicitly - a negative slice start would
+        # silently wrap around instead of raising.
+        for x, y in self._sprite_region_xy:
+            sx, sy = int(x) // 8, int(y) // 8
+            block = pixels[max(0, sx - half) : sx + half, max(0, sy - half) : sy + half]
+            if block.size and block.mean() < 10.0:
+                transparent_regions.append((int(x), int(y)))
 
         return transparent_regions
 
-    def _is_region_transparent(
-        self, screen: pygame.Surface, x: int, y: int, width: int, height: int
-    ) -> bool:
-        """Check if a region is mostly transparent."""
-        # Simplified check - in reality we'd sample the region properly
-        try:
-            color = screen.get_at((x + width // 2, y + height // 2))
-            return color.a < 128  # Less than 50% opacity
-        except Exception:
-            return False
+    def _check_ui_elements(self, scene: str, frame_t: float, door_dark) -> None:
+        """Check if UI elements are properly positioned.
 
-    def _check_ui_elements(self, screen: pygame.Surface, scene: str) -> None:
-        """Check if UI elements are properly positioned."""
+        ``door_dark`` comes from the frame's pixel view (fused kernel or
+        vectorized NumPy probe) - no per-door ``get_at`` calls here.
+        """
         # Scene-specific UI checks
         if scene == "hub_world":
             # Check if doors are visible
-            door_positions = [(200, 300), (400, 300), (600, 300)]
-            for x, y in door_positions:
-                color = screen.get_at((x, y))
-                if color == (0, 0, 0, 255):  # Pure black
-                    self.visual_bugs.append(
-                        VisualBug(
-                            timestamp=time.time() - self.start_time,
-                            scene=scene,
-                            bug_type="missing_ui_element",
-                            description=f"Door not visible at position ({x}, {y})",
-                            location=(x, y),
-                            severity="medium",
-                        )
+            for (x, y), dark in zip(self._door_probe_xy, door_dark, strict=True):
+                if dark:  # Pure black
+                    door_x, door_y = int(x), int(y)
+                    self._record_visual(
+                        frame_t,
+                        scene,
+                        "missing_ui_element",
+                        f"Door not visible at position ({door_x}, {door_y})",
+                        location=(door_x, door_y),
                     )
 
-    def _check_audio_status(self, scene_manager) -> None:
+    def _check_audio_status(self, scene_manager, frame_t: float) -> None:
         """Check audio system status."""
         try:
             # Check if music is playing
             if hasattr(scene_manager, "sound_manager"):
                 # Check if any music should be playing
                 if not pygame.mixer.music.get_busy():
-                    self.audio_bugs.append(
+                    self._record_audio(
                         AudioBug(
-                            timestamp=time.time() - self.start_time,
+                            timestamp=frame_t,
                             scene=self.current_scene,
                             bug_type="no_music",
                             description="No background music playing",
@@ -395,9 +551,9 @@ class AutomatedGameTester:
                 # Check volume levels
                 volume = pygame.mixer.music.get_volume()
                 if volume == 0:
-                    self.audio_bugs.append(
+                    self._record_audio(
                         AudioBug(
-                            timestamp=time.time() - self.start_time,
+                            timestamp=frame_t,
                             scene=self.current_scene,
                             bug_type="muted_music",
                             description="Music volume is set to 0",
@@ -406,9 +562,9 @@ class AutomatedGameTester:
                     )
 
         except Exception as e:
-            self.audio_bugs.append(
+            self._record_audio(
                 AudioBug(
-                    timestamp=time.time() - self.start_time,
+                    timestamp=frame_t,
                     scene=self.current_scene,
                     bug_type="audio_error",
                     description=f"Error checking audio: {str(e)}",
@@ -416,41 +572,113 @@ class AutomatedGameTester:
                 )
             )
 
-    def _track_performance(self, dt: float) -> None:
+    def _track_performance(self, dt: float, current_time: float) -> None:
         """Track performance metrics."""
-        current_time = time.time()
-
         # Calculate FPS every second
         if current_time - self.last_fps_check >= 1.0:
-            fps = self.frame_count / (current_time - self.start_time)
-            self.fps_samples.append(fps)
-
-            # Check for low FPS
-            if fps < 30:
-                self.performance_issues.append(
+            interval = current_time - self.last_fps_check
+            fps = (self.frame_count - self._frames_at_last_check) / interval
+            if self._fps_n < self._fps_buf.size:
+                self._fps_buf[self._fps_n] = fps
+                self._fps_n += 1
+            self._frames_at_last_check = self.frame_count
+
+            # The loop runs uncapped, so judge each sample against the
+            # throughput the machine demonstrated on its first sample
+            # rather than an absolute 30 FPS budget
+            if self._fps_baseline is None:
+                self._fps_baseline = fps
+            elif fps < self._fps_baseline * 0.5:
+                self._record_performance(
                     PerformanceIssue(
                         timestamp=current_time - self.start_time,
                         scene=self.current_scene,
                         fps=fps,
                         frame_time_ms=1000 / fps if fps > 0 else 999,
-                        description=f"Low FPS detected: {fps:.1f}",
-                        severity="medium" if fps > 20 else "high",
+                        description=(
+                            f"Frame rate dropped to {fps:.1f} "
+                            f"(baseline {self._fps_baseline:.1f})"
+                        ),
+                        severity="medium"
+                        if fps > self._fps_baseline * 0.25
+                        else "high",
                     )
                 )
 
             self.last_fps_check = current_time
 
+    def _record_audio(self, bug: AudioBug) -> None:
+        """Record an audio bug and stream it to the JSONL sidecar."""
+        self.audio_bugs.append(bug)
+        self._append_bug("audio", asdict(bug))
+
+    def _record_performance(self, issue: PerformanceIssue) -> None:
+        """Record a performance issue and stream it to the JSONL sidecar."""
+        self.performance_issues.append(issue)
+        self._append_bug("performance", asdict(issue))
+
+    def _record_visual(
+        self,
+        frame_t: float,
+        scene: str,
+        bug_type: str,
+        description: str,
+        location: tuple[int, int] | None = None,
+        severity: str = "medium",
+    ) -> None:
+        """Stage a visual bug and stream it to the JSONL sidecar."""
+        self._pending_visual.append(
+            (frame_t, scene, bug_type, description, location, severity)
+        )
+        self._append_bug(
+            "visual",
+            {
+                "timestamp": frame_t,
+                "scene": scene,
+                "bug_type": bug_type,
+                "description": description,
+                "location": location,
+                "severity": severity,
+            },
+        )
+
+    def _append_bug(self, kind: str, record: dict[str, Any]) -> None:
+        """Stream one bug record to the JSONL sidecar."""
+        payload = {"kind": kind, **record}
+        if orjson is not None:
+            line = orjson.dumps(payload).decode()
+        else:
+            line = json.dumps(payload)
+        self._bug_jsonl.write(line + "\n")
+        self._bug_records_written += 1
+        if self._bug_records_written % 32 == 0:
+            self._bug_jsonl.flush()
+
     def _record_crash(self, exception: Exception, scene_manager) -> None:
         """Record a crash or exception."""
-        self.crashes.append(
-            CrashReport(
-                timestamp=time.time() - self.start_time,
-                scene=self.current_scene,
-                exception_type=type(exception).__name__,
-                message=str(exception),
-                traceback=traceback.format_exc(),
-                severity="high",
-            )
+        exc_name = type(exception).__name__
+        crash = CrashReport(
+            timestamp=time.time() - self.start_time,
+            scene=self.current_scene,
+            exception_type=exc_name,
+            message=str(exception),
+            # Capturing the frames is ~10x cheaper than rendering them;
+            # the string is produced once at report time
+            traceback=traceback.TracebackException.from_exception(exception),
+            severity="high",
+        )
+        self.crashes.append(crash)
+        # The sidecar gets the crash without the traceback (it is not a
+        # string yet); the full text lands in the final report
+        self._append_bug(
+            "crash",
+            {
+                "timestamp": crash.timestamp,
+                "scene": crash.scene,
+                "exception_type": crash.exception_type,
+                "message": crash.message,
+                "severity": crash.severity,
+            },
         )
 
     def _get_scene_name(self, scene_manager) -> str:
@@ -463,19 +691,50 @@ class AutomatedGameTester:
         return "unknown"
 
     def _save_screenshot(self, screen: pygame.Surface, name: str) -> str:
-        """Save a screenshot for analysis."""
+        """Queue a screenshot for the background writer thread."""
         filename = f"{name}_{int(time.time())}.png"
         filepath = self.screenshot_dir / filename
-        pygame.image.save(screen, str(filepath))
+        # Small memcpy now; PNG encoding happens off the main loop
+        pixels = pygame.surfarray.array3d(screen)
+        try:
+            self._screenshot_q.put_nowait((pixels, filepath))
+        except queue.Full:
+            # Drop the oldest queued shot - screenshots are sampled, not
+            # required, so never stall the test loop waiting for the writer
+            try:
+                self._screenshot_q.get_nowait()
+                self._screenshot_q.put_nowait((pixels, filepath))
+            except (queue.Empty, queue.Full):
+                pass
         return str(filepath)
 
+    def _screenshot_worker(self) -> None:
+        """Encode queued screenshots to PNG until the sentinel arrives."""
+        while True:
+            item = self._screenshot_q.get()
+            if item is None:
+                break
+            pixels, filepath = item
+            surface = pygame.surfarray.make_surface(pixels)
+            pygame.image.save(surface, str(filepath))
+
     def _generate_report(self) -> dict[str, Any]:
         """Generate test report."""
+        # Materialize staged visual-bug tuples into dataclasses now that
+        # the hot loop is over
+        self.visual_bugs.extend(VisualBug(*bug) for bug in self._pending_visual)
+        self._pending_visual.clear()
+
+        # Render deferred crash tracebacks to strings for serialization
+        for crash in self.crashes:
+            if not isinstance(crash.traceback, str):
+                crash.traceback = "".join(crash.traceback.format())
+
         report = {
             "test_duration": time.time() - self.start_time,
             "total_frames": self.frame_count,
-            "average_fps": sum(self.fps_samples) / len(self.fps_samples)
-            if self.fps_samples
+            "average_fps": float(self._fps_buf[: self._fps_n].mean())
+            if self._fps_n
             else 0,
             "visual_bugs": len(self.visual_bugs),
             "audio_bugs": len(self.audio_bugs),
@@ -491,10 +750,17 @@ class AutomatedGameTester:
             },
         }
 
+        # Close the streaming sidecar now that the run is over
+        self._bug_jsonl.flush()
+        self._bug_jsonl.close()
+
         # Save report to file
         report_path = self.output_dir / f"test_report_{int(time.time())}.json"
-        with open(report_path, "w") as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, "w") as f:
+                json.dump(report, f, indent=2)
 
         # Print summary
         self._print_summary(report)
@@ -523,10 +789,10 @@ class AutomatedGameTester:
 
         if report["visual_bugs"] > 0:
             print("\n⚠️  Visual issues detected:")
-            bug_types = defaultdict(int)
-            for bug in report["details"]["visual_bugs"]:
-                bug_types[bug["bug_type"]] += 1
-            for bug_type, count in bug_types.items():
+            bug_types = Counter(
+                bug["bug_type"] for bug in report["details"]["visual_bugs"]
+            )
+            for bug_type, count in bug_types.most_common():
                 print(f"  - {bug_type}: {count} occurrences")
 
         print("\n📊 Full report saved to:", self.output_dir)
@@ -5,11 +5,164 @@ Shows animated celebrations for achievements and milestones
 """
 
 import math
-import random
 import sys
 
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy update path is used
+    njit = None
+
+# Numeric effect ids for the jitted integrator
+TYPE_CONFETTI, TYPE_FIREWORKS, TYPE_STARS = 0, 1, 2
+_TYPE_IDS = {
+    "confetti": TYPE_CONFETTI,
+    "fireworks": TYPE_FIREWORKS,
+    "stars": TYPE_STARS,
+}
+
+
+def _integrate_particles(
+    x,
+    y,
+    vx,
+    vy,
+    size,
+    angle,
+    spin,
+    life,
+    twinkle,
+    twinkle_speed,
+    color,
+    color_idx,
+    n,
+    type_id,
+):
+    """Fused single-pass particle integrator with in-place compaction.
+
+    Updates every column for the first ``n`` particles, packs survivors to
+    the front, and returns the new live count. Compiled with numba when
+    available so the whole update is one machine-code loop.
+    """
+    m = 0
+    for i in range(n):
+        x[i] += vx[i]
+        y[i] += vy[i]
+        if type_id != TYPE_STARS:
+            vy[i] += 0.1
+        if type_id == TYPE_CONFETTI:
+            angle[i] += spin[i]
+        elif type_id == TYPE_STARS:
+            twinkle[i] += twinkle_speed[i]
+
+        if type_id == TYPE_FIREWORKS:
+            life[i] -= 1
+            alive = life[i] > 0
+        else:
+            alive = 0 <= x[i] <= 800 and y[i] <= 650
+
+        if alive:
+            if m != i:
+                x[m] = x[i]
+                y[m] = y[i]
+                vx[m] = vx[i]
+                vy[m] = vy[i]
+                size[m] = size[i]
+                angle[m] = angle[i]
+                spin[m] = spin[i]
+                life[m] = life[i]
+                twinkle[m] = twinkle[i]
+                twinkle_speed[m] = twinkle_speed[i]
+                color[m] = color[i]
+                color_idx[m] = color_idx[i]
+            m += 1
+    return m
+
+
+if njit is not None:
+    _integrate_particles = njit(cache=True, fastmath=True)(_integrate_particles)
+    # Warm-compile on import so the first frame doesn't pay the JIT cost
+    _z = np.zeros(1)
+    _integrate_particles(
+        _z,
+        _z.copy(),
+        _z.copy(),
+        _z.copy(),
+        _z.copy(),
+        _z.copy(),
+        _z.copy(),
+        _z.copy(),
+        _z.copy(),
+        _z.copy(),
+        np.zeros((1, 3), np.uint8),
+        np.zeros(1, np.uint8),
+        1,
+        TYPE_STARS,
+    )
+else:
+    _integrate_particles = None
+
+# Confetti palette shared by the initial burst and the per-frame spawner
+CONFETTI_COLORS = (
+    (255, 0, 0),  # Red
+    (0, 255, 0),  # Green
+    (0, 0, 255),  # Blue
+    (255, 255, 0),  # Yellow
+    (255, 0, 255),  # Magenta
+    (0, 255, 255),  # Cyan
+)
+
+
+class Particles:
+    """Struct-of-arrays particle store.
+
+    Each field is a preallocated NumPy column and ``n`` is the live count,
+    so the per-frame update is a handful of vector ops instead of hundreds
+    of per-dict field lookups. Palette-drawn effects (confetti) store one
+    uint8 palette index per particle; randomly colored effects keep uint8
+    RGB columns.
+    """
+
+    PALETTE = np.asarray(CONFETTI_COLORS, np.uint8)
+
+    COLUMNS = (
+        "x",
+        "y",
+        "vx",
+        "vy",
+        "size",
+        "angle",
+        "spin",
+        "life",
+        "twinkle",
+        "twinkle_speed",
+    )
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.n = 0
+        for name in self.COLUMNS:
+            setattr(self, name, np.zeros(capacity))
+        self.color = np.zeros((capacity, 3), np.uint8)
+        self.color_idx = np.zeros(capacity, np.uint8)
+
+    def room(self, count):
+        """How many of ``count`` new particles actually fit."""
+        return min(count, self.capacity - self.n)
+
+    def compact(self, keep):
+        """Drop dead particles, packing survivors to the front in place."""
+        idx = np.nonzero(keep)[0]
+        m = idx.size
+        for name in self.COLUMNS:
+            col = getattr(self, name)
+            col[:m] = col[idx]
+        self.color[:m] = self.color[idx]
+        self.color_idx[:m] = self.color_idx[idx]
+        self.n = m
+
 
 class Celebration:
     def __init__(self, message="Great Job!", celebration_type="confetti"):
@@ -19,194 +172,276 @@ class Celebration:
         self.clock = pygame.time.Clock()
         self.message = message
         self.type = celebration_type
-        self.particles = []
+        self.particles = Particles()
+        self.rng = np.random.default_rng()
+        # Unit 10-point star outline, precomputed once; drawing scales it
+        # by each star's current size instead of redoing the trig.
+        angles = np.arange(10) * math.pi / 5 - math.pi / 2
+        radii = np.where(np.arange(10) % 2 == 0, 1.0, 0.5)
+        self._star_template = np.stack(
+            (radii * np.cos(angles), radii * np.sin(angles)), axis=1
+        )
+        # Rotated confetti sprites, keyed by (palette index, size,
+        # 10-degree bucket) and rendered once on first use
+        self._confetti_cache = {}
+        # Firework glow sprites, keyed by (radius, r, g, b); each burst
+        # uses one color at a handful of shrinking radii
+        self._glow_cache = {}
         self.font = pygame.font.Font(None, 72)
+        self._text_cache = None  # Rendered message/shadow/subtitle surfaces
+        # Bounding rects drawn last frame; only these get cleared and
+        # pushed to the display each frame
+        self._prev_rects = []
+        self._cur_rects = []
         self.small_font = pygame.font.Font(None, 36)
 
     def create_confetti(self):
         """Create confetti particles"""
-        colors = [
-            (255, 0, 0),  # Red
-            (0, 255, 0),  # Green
-            (0, 0, 255),  # Blue
-            (255, 255, 0),  # Yellow
-            (255, 0, 255),  # Magenta
-            (0, 255, 255),  # Cyan
-        ]
-
-        for _ in range(100):
-            self.particles.append(
-                {
-                    "x": random.randint(0, 800),
-                    "y": random.randint(-600, 0),
-                    "vx": random.uniform(-2, 2),
-                    "vy": random.uniform(2, 5),
-                    "color": random.choice(colors),
-                    "angle": random.uniform(0, 360),
-                    "spin": random.uniform(-10, 10),
-                    "size": random.randint(10, 20),
-                }
-            )
+        self._spawn_confetti(100, -600, 0)
+
+    def _spawn_confetti(self, count, y_low, y_high):
+        """Fill SoA slots with new confetti particles."""
+        p = self.particles
+        count = p.room(count)
+        if not count:
+            return
+        s = slice(p.n, p.n + count)
+        rng = self.rng
+        p.x[s] = rng.integers(0, 801, count)
+        p.y[s] = rng.integers(y_low, y_high + 1, count)
+        p.vx[s] = rng.uniform(-2, 2, count)
+        p.vy[s] = rng.uniform(2, 5, count)
+        p.color_idx[s] = rng.integers(0, len(CONFETTI_COLORS), count)
+        p.angle[s] = rng.uniform(0, 360, count)
+        p.spin[s] = rng.uniform(-10, 10, count)
+        p.size[s] = rng.integers(10, 21, count)
+        p.n += count
 
     def create_fireworks(self):
         """Create firework bursts"""
         # Create multiple bursts
         for _ in range(3):
-            x = random.randint(200, 600)
-            y = random.randint(150, 350)
+            x = int(self.rng.integers(200, 601))
+            y = int(self.rng.integers(150, 351))
             self.firework_burst(x, y, 50)
 
     def firework_burst(self, x, y, count):
         """Create a burst of particles"""
+        rng = self.rng
         color = (
-            random.randint(200, 255),
-            random.randint(100, 255),
-            random.randint(100, 255),
+            rng.integers(200, 256),
+            rng.integers(100, 256),
+            rng.integers(100, 256),
         )
 
-        for i in range(count):
-            angle = (360 / count) * i + random.uniform(-5, 5)
-            speed = random.uniform(3, 6)
-            self.particles.append(
-                {
-                    "x": x,
-                    "y": y,
-                    "vx": math.cos(math.radians(angle)) * speed,
-                    "vy": math.sin(math.radians(angle)) * speed,
-                    "color": color,
-                    "life": 60,
-                    "size": random.randint(3, 8),
-                }
-            )
+        p = self.particles
+        count = p.room(count)
+        if not count:
+            return
+        s = slice(p.n, p.n + count)
+        angles = np.radians(
+            np.arange(count) * (360 / count) + rng.uniform(-5, 5, count)
+        )
+        speeds = rng.uniform(3, 6, count)
+        p.x[s] = x
+        p.y[s] = y
+        p.vx[s] = np.cos(angles) * speeds
+        p.vy[s] = np.sin(angles) * speeds
+        p.color[s] = color
+        p.life[s] = 60
+        p.size[s] = rng.integers(3, 9, count)
+        p.n += count
 
     def create_stars(self):
         """Create twinkling stars"""
-        for _ in range(50):
-            self.particles.append(
-                {
-                    "x": random.randint(0, 800),
-                    "y": random.randint(0, 400),
-                    "vx": random.uniform(-0.5, 0.5),
-                    "vy": random.uniform(-0.5, 0.5),
-                    "color": (255, 255, 0),
-                    "twinkle": random.uniform(0, math.pi * 2),
-                    "twinkle_speed": random.uniform(0.05, 0.15),
-                    "size": random.randint(10, 30),
-                }
-            )
+        p = self.particles
+        rng = self.rng
+        count = p.room(50)
+        s = slice(p.n, p.n + count)
+        p.x[s] = rng.integers(0, 801, count)
+        p.y[s] = rng.integers(0, 401, count)
+        p.vx[s] = rng.uniform(-0.5, 0.5, count)
+        p.vy[s] = rng.uniform(-0.5, 0.5, count)
+        p.color[s] = (255, 255, 0)
+        p.twinkle[s] = rng.uniform(0, math.pi * 2, count)
+        p.twinkle_speed[s] = rng.uniform(0.05, 0.15, count)
+        p.size[s] = rng.integers(10, 31, count)
+        p.n += count
 
     def update_particles(self):
-        """Update particle positions and properties"""
-        new_particles = []
-
-        for particle in self.particles:
-            # Update position
-            particle["x"] += particle.get("vx", 0)
-            particle["y"] += particle.get("vy", 0)
-
-            # Apply gravity to confetti and fireworks
-            if self.type in ["confetti", "fireworks"]:
-                particle["vy"] += 0.1
-
-            # Update rotation for confetti
-            if "angle" in particle:
-                particle["angle"] += particle.get("spin", 0)
-
-            # Update twinkle for stars
-            if "twinkle" in particle:
-                particle["twinkle"] += particle["twinkle_speed"]
-
-            # Update life for fireworks
-            if "life" in particle:
-                particle["life"] -= 1
-                if particle["life"] > 0:
-                    new_particles.append(particle)
-            # Keep particle if on screen
-            elif 0 <= particle["x"] <= 800 and particle["y"] <= 650:
-                new_particles.append(particle)
+        """Update particle positions and properties.
+
+        run() rebinds this to the per-type method below, so the generic
+        dispatch only happens if a caller updates before run().
+        """
+        getattr(self, f"_update_{self.type}")()
+
+    def _integrate(self, type_id):
+        """Run the jitted integrator if numba is available"""
+        p = self.particles
+        p.n = _integrate_particles(
+            p.x,
+            p.y,
+            p.vx,
+            p.vy,
+            p.size,
+            p.angle,
+            p.spin,
+            p.life,
+            p.twinkle,
+            p.twinkle_speed,
+            p.color,
+            p.color_idx,
+            p.n,
+            type_id,
+        )
 
-        self.particles = new_particles
+    def _update_confetti(self):
+        p = self.particles
+        n = p.n
+        if not n:
+            return
+        if _integrate_particles is not None:
+            self._integrate(TYPE_CONFETTI)
+            return
+        p.x[:n] += p.vx[:n]
+        p.y[:n] += p.vy[:n]
+        p.vy[:n] += 0.1  # Gravity
+        p.angle[:n] += p.spin[:n]
+        keep = (p.x[:n] >= 0) & (p.x[:n] <= 800) & (p.y[:n] <= 650)
+        if not keep.all():
+            p.compact(keep)
+
+    def _update_fireworks(self):
+        p = self.particles
+        n = p.n
+        if not n:
+            return
+        if _integrate_particles is not None:
+            self._integrate(TYPE_FIREWORKS)
+            return
+        p.x[:n] += p.vx[:n]
+        p.y[:n] += p.vy[:n]
+        p.vy[:n] += 0.1  # Gravity
+        p.life[:n] -= 1
+        keep = p.life[:n] > 0
+        if not keep.all():
+            p.compact(keep)
+
+    def _update_stars(self):
+        p = self.particles
+        n = p.n
+        if not n:
+            return
+        if _integrate_particles is not None:
+            self._integrate(TYPE_STARS)
+            return
+        p.x[:n] += p.vx[:n]
+        p.y[:n] += p.vy[:n]
+        p.twinkle[:n] += p.twinkle_speed[:n]
+        keep = (p.x[:n] >= 0) & (p.x[:n] <= 800) & (p.y[:n] <= 650)
+        if not keep.all():
+            p.compact(keep)
+
+    @staticmethod
+    def _make_glow(radius, color):
+        """Render one glowing-circle sprite: filled core plus halo ring"""
+        span = 2 * radius + 6
+        sprite = pygame.Surface((span, span), pygame.SRCALPHA)
+        center = span // 2
+        pygame.draw.circle(sprite, color, (center, center), radius)
+        glow_color = tuple(int(c * 0.5) for c in color)
+        pygame.draw.circle(sprite, glow_color, (center, center), radius + 2, 1)
+        return sprite
 
     def draw_particles(self):
-        """Draw all particles"""
-        for particle in self.particles:
-            x, y = int(particle["x"]), int(particle["y"])
-            color = particle["color"]
-            size = particle.get("size", 10)
-
-            if self.type == "confetti":
-                # Draw rotated rectangle
-                points = []
-                angle = particle.get("angle", 0)
-                for dx, dy in [
-                    (-size / 2, -size / 3),
-                    (size / 2, -size / 3),
-                    (size / 2, size / 3),
-                    (-size / 2, size / 3),
-                ]:
-                    rx = dx * math.cos(math.radians(angle)) - dy * math.sin(
-                        math.radians(angle)
-                    )
-                    ry = dx * math.sin(math.radians(angle)) + dy * math.cos(
-                        math.radians(angle)
+        """Draw all particles, collecting their bounding rects"""
+        p = self.particles
+        n = p.n
+        rects = self._cur_rects
+
+        if self.type == "confetti":
+            # Blit cached pre-rotated sprites instead of filling polygons.
+            # Angles snap to 10-degree buckets, so each (color, size)
+            # pair renders at most 36 tiny surfaces for the whole run.
+            cache = self._confetti_cache
+            buckets = (p.angle[:n] // 10).astype(np.int64) % 36
+            for x, y, size, bucket, color_idx in zip(
+                p.x[:n], p.y[:n], p.size[:n], buckets, p.color_idx[:n], strict=True
+            ):
+                sprite_size = int(size)
+                key = (color_idx, sprite_size, bucket)
+                sprite = cache.get(key)
+                if sprite is None:
+                    base = pygame.Surface(
+                        (sprite_size, max(1, sprite_size * 2 // 3)), pygame.SRCALPHA
                     )
-                    points.append((x + rx, y + ry))
-                pygame.draw.polygon(self.screen, color, points)
+                    base.fill(tuple(Particles.PALETTE[color_idx]))
+                    sprite = pygame.transform.rotate(base, -10 * int(bucket))
+                    cache[key] = sprite
+                rect = sprite.get_rect(center=(int(x), int(y)))
+                self.screen.blit(sprite, rect)
+                rects.append(rect)
 
-            elif self.type == "fireworks":
-                # Draw glowing circle
-                life_ratio = particle.get("life", 60) / 60
-                current_size = int(size * life_ratio)
+        elif self.type == "fireworks":
+            # Blit cached glow sprites instead of rasterizing two circles
+            # per particle every frame
+            cache = self._glow_cache
+            for x, y, size, life, color in zip(
+                p.x[:n], p.y[:n], p.size[:n], p.life[:n], p.color[:n], strict=True
+            ):
+                current_size = int(size * life / 60)
                 if current_size > 0:
-                    pygame.draw.circle(self.screen, color, (x, y), current_size)
-                    # Add glow effect
-                    glow_color = tuple(int(c * 0.5) for c in color)
-                    pygame.draw.circle(
-                        self.screen, glow_color, (x, y), current_size + 2, 1
-                    )
+                    key = (current_size, color[0], color[1], color[2])
+                    sprite = cache.get(key)
+                    if sprite is None:
+                        sprite = self._make_glow(current_size, tuple(color))
+                        cache[key] = sprite
+                    rect = sprite.get_rect(center=(int(x), int(y)))
+                    self.screen.blit(sprite, rect)
+                    rects.append(rect)
 
-            elif self.type == "stars":
-                # Draw twinkling star
-                twinkle = particle.get("twinkle", 0)
+        elif self.type == "stars":
+            # Draw twinkling stars
+            for x, y, size, twinkle, color in zip(
+                p.x[:n], p.y[:n], p.size[:n], p.twinkle[:n], p.color[:n], strict=True
+            ):
                 brightness = (math.sin(twinkle) + 1) / 2
                 current_size = int(size * (0.5 + brightness * 0.5))
 
-                # Draw star shape
-                points = []
-                for i in range(10):
-                    angle = i * math.pi / 5
-                    if i % 2 == 0:
-                        r = current_size
-                    else:
-                        r = current_size * 0.5
-                    px = x + r * math.cos(angle - math.pi / 2)
-                    py = y + r * math.sin(angle - math.pi / 2)
-                    points.append((px, py))
+                # Scale and translate the cached unit star
+                points = self._star_template * current_size + (int(x), int(y))
 
                 star_color = tuple(int(c * brightness) for c in color)
                 pygame.draw.polygon(self.screen, star_color, points)
+                r = current_size + 1
+                rects.append(pygame.Rect(x - r, y - r, 2 * r, 2 * r))
 
     def draw_message(self):
         """Draw the celebration message"""
-        # Create text surface
-        text_surface = self.font.render(self.message, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=(400, 300))
-
-        # Draw shadow
-        shadow_surface = self.font.render(self.message, True, (0, 0, 0))
-        shadow_rect = text_rect.copy()
-        shadow_rect.x += 3
-        shadow_rect.y += 3
-        self.screen.blit(shadow_surface, shadow_rect)
-
-        # Draw main text
-        self.screen.blit(text_surface, text_rect)
-
-        # Draw subtitle
-        subtitle = "Press any key to continue..."
-        subtitle_surface = self.small_font.render(subtitle, True, (200, 200, 200))
-        subtitle_rect = subtitle_surface.get_rect(center=(400, 400))
-        self.screen.blit(subtitle_surface, subtitle_rect)
+        if self._text_cache is None:
+            # Render the static text once; blits are all that happen
+            # per frame afterwards
+            text_surface = self.font.render(self.message, True, (255, 255, 255))
+            text_rect = text_surface.get_rect(center=(400, 300))
+
+            shadow_surface = self.font.render(self.message, True, (0, 0, 0))
+            shadow_rect = text_rect.copy()
+            shadow_rect.x += 3
+            shadow_rect.y += 3
+
+            subtitle = "Press any key to continue..."
+            subtitle_surface = self.small_font.render(subtitle, True, (200, 200, 200))
+            subtitle_rect = subtitle_surface.get_rect(center=(400, 400))
+
+            self._text_cache = (
+                (shadow_surface, shadow_rect),
+                (text_surface, text_rect),
+                (subtitle_surface, subtitle_rect),
+            )
+
+        for surface, rect in self._text_cache:
+            self.screen.blit(surface, rect)
 
     def run(self):
         """Run celebration animation"""
@@ -222,62 +457,61 @@ class Celebration:
             self.type = "confetti"
             self.create_confetti()
 
+        # Bind the type-specific update once, outside the frame loop
+        self.update_particles = getattr(self, f"_update_{self.type}")
+
+        # Only the two event types we act on ever enter the queue, so a
+        # single peek per frame replaces draining the whole queue
+        pygame.event.set_allowed(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+        pygame.event.clear()
+
         # Animation loop
         running = True
         duration = 5000  # 5 seconds
         start_time = pygame.time.get_ticks()
+        background = (20, 20, 40)
+
+        # Paint the static background and text once; afterwards only the
+        # rects particles touched get cleared and pushed to the display
+        self.screen.fill(background)
+        self.draw_message()
+        pygame.display.flip()
+        self._prev_rects = []
 
         while running:
             current_time = pygame.time.get_ticks()
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT or event.type == pygame.KEYDOWN:
-                    running = False
+            if pygame.event.peek((pygame.QUIT, pygame.KEYDOWN)):
+                running = False
 
             # Auto-close after duration
             if current_time - start_time > duration:
                 running = False
 
-            # Clear screen with dark background
-            self.screen.fill((20, 20, 40))
+            # Clear only last frame's particle rects
+            for rect in self._prev_rects:
+                self.screen.fill(background, rect)
 
             # Update and draw particles
             self.update_particles()
+            self._cur_rects = []
             self.draw_particles()
 
-            # Draw message
+            # Redraw the message over any cleared overlap
             self.draw_message()
 
             # Add more particles for continuous effect
             if (
                 self.type == "confetti"
-                and len(self.particles) < 100
-                and random.random() < 0.3
+                and self.particles.n < 100
+                and self.rng.random() < 0.3
             ):
-                self.particles.append(
-                    {
-                        "x": random.randint(0, 800),
-                        "y": -20,
-                        "vx": random.uniform(-2, 2),
-                        "vy": random.uniform(2, 5),
-                        "color": random.choice(
-                            [
-                                (255, 0, 0),
-                                (0, 255, 0),
-                                (0, 0, 255),
-                                (255, 255, 0),
-                                (255, 0, 255),
-                                (0, 255, 255),
-                            ]
-                        ),
-                        "angle": random.uniform(0, 360),
-                        "spin": random.uniform(-10, 10),
-                        "size": random.randint(10, 20),
-                    }
-                )
-
-            # Update display
-            pygame.display.flip()
+                self._spawn_confetti(1, -20, -20)
+
+            # Push only the damaged regions
+            pygame.display.update(self._prev_rects + self._cur_rects)
+            self._prev_rects = self._cur_rects
             self.clock.tick(60)
 
         pygame.quit()
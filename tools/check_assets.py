@@ -65,20 +65,61 @@ REQUIRED_ASSETS = {
 }
 
 
-def check_assets() -> tuple[list[str], list[str]]:
-    """Check for missing and extra assets."""
-    missing = []
-    found = []
-
-    # Check required assets
-    for category, files in REQUIRED_ASSETS.items():
-        category_path = ASSETS_DIR / category
-        for filename in files:
-            file_path = category_path / filename
-            if file_path.exists():
-                found.append(str(file_path.relative_to(PROJECT_ROOT)))
-            else:
-                missing.append(str(file_path.relative_to(PROJECT_ROOT)))
+# Flattened at import so the check itself is pure set arithmetic
+REQUIRED_SET = frozenset(
+    f"assets/{category}/{filename}"
+    for category, files in REQUIRED_ASSETS.items()
+    for filename in files
+)
+
+ASSET_EXTENSIONS = (".png", ".ogg", ".mp3", ".wav")
+
+
+def iter_assets(root: str):
+    """Yield raw str paths of asset files under ``root``.
+
+    Walks with an explicit os.scandir stack, so each entry's type comes
+    from the directory listing itself and names are filtered inline
+    without building intermediate Path objects.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(ASSET_EXTENSIONS):
+                    yield entry.path
+
+
+def scan_assets() -> set[str]:
+    """Scan the assets tree once into a set of existing asset paths.
+
+    Paths are normalized to forward slashes to match REQUIRED_SET on
+    every platform.
+    """
+    prefix_len = len(str(PROJECT_ROOT)) + 1
+    return {
+        path[prefix_len:].replace(os.sep, "/") for path in iter_assets(str(ASSETS_DIR))
+    }
+
+
+def check_assets(existing: set[str] | None = None) -> tuple[list[str], list[str]]:
+    """Check for missing and extra assets.
+
+    One directory-tree scan plus two set differences against the
+    precomputed required set replaces a stat call per required file.
+    """
+    if existing is None:
+        existing = scan_assets()
+
+    # Sorted so the report order is stable run to run
+    missing = sorted(REQUIRED_SET - existing)
+    found = sorted(REQUIRED_SET & existing)
 
     return missing, found
 
@@ -89,7 +130,8 @@ def main():
     print(f"Assets directory: {ASSETS_DIR}")
     print()
 
-    missing, found = check_assets()
+    existing = scan_assets()
+    missing, found = check_assets(existing)
 
     # Report found assets
     if found:
@@ -110,15 +152,8 @@ def main():
     else:
         print("[SUCCESS] All required assets found!")
 
-    # Check for extra assets (informational only)
-    all_assets = []
-    for root, dirs, files in os.walk(ASSETS_DIR):
-        for file in files:
-            if file.endswith((".png", ".ogg", ".mp3", ".wav")):
-                path = Path(root) / file
-                all_assets.append(str(path.relative_to(PROJECT_ROOT)))
-
-    extra = set(all_assets) - set(found)
+    # Check for extra assets (informational only) — reuse the single scan
+    extra = existing - REQUIRED_SET
     if extra:
         print()
         print(f"[INFO] Found {len(extra)} additional assets (not required):")
@@ -4,12 +4,18 @@ Asset Download Tool for Danger Rose
 Downloads high-quality character sprites from various free sources.
 """
 
+import os
 import shutil
 import zipfile
 from pathlib import Path
 
 import requests
 
+try:
+    from tqdm import tqdm
+except ImportError:  # optional; falls back to throttled prints
+    tqdm = None
+
 
 class AssetDownloader:
     def __init__(self):
@@ -38,17 +44,42 @@ class AssetDownloader:
             total_size = int(response.headers.get("content-length", 0))
 
             with open(filepath, "wb") as f:
+                # Reserve the whole file up front when the size is known,
+                # so the filesystem allocates one extent instead of
+                # growing the file chunk by chunk
+                if total_size > 0 and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, total_size)
+                    except OSError:
+                        pass
+                elif total_size > 0:
+                    f.truncate(total_size)
+                    f.seek(0)
+
                 downloaded = 0
-                for chunk in response.iter_content(chunk_size=8192):
+                next_report = 0
+                # tqdm rate-limits its own refreshes; the fallback prints
+                # at most every 4 MiB so terminal writes never dominate
+                bar = (
+                    tqdm(total=total_size, unit="B", unit_scale=True, unit_divisor=1024)
+                    if tqdm is not None and total_size > 0
+                    else None
+                )
+                for chunk in response.iter_content(chunk_size=1 << 20):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
-                        if total_size > 0:
+                        if bar is not None:
+                            bar.update(len(chunk))
+                        elif total_size > 0 and downloaded >= next_report:
+                            next_report = downloaded + (4 << 20)
                             percent = (downloaded / total_size) * 100
                             print(
                                 f"\\r  Progress: {percent:.1f}% ({downloaded:,} / {total_size:,} bytes)",
                                 end="",
                             )
+                if bar is not None:
+                    bar.close()
 
             print(f"\\n  Downloaded: {filepath}")
             return filepath
@@ -62,8 +93,24 @@ class AssetDownloader:
         print(f"Extracting {zip_path.name}...")
 
         try:
+            extract_to = Path(extract_to).resolve()
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(extract_to)
+                # Stream each member with a large copy buffer instead of
+                # extractall's default small-chunk copies
+                for info in zip_ref.infolist():
+                    target = extract_to / info.filename
+                    # extractall sanitizes hostile member names; the
+                    # manual loop must too. Reject anything that would
+                    # land outside extract_to ("../" or absolute paths)
+                    if not target.resolve().is_relative_to(extract_to):
+                        print(f"  Skipping unsafe member: {info.filename}")
+                        continue
+                    if info.is_dir():
+                        target.mkdir(parents=True, exist_ok=True)
+                        continue
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with zip_ref.open(info) as src, open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst, length=1 << 20)
 
             print(f"  Extracted to: {extract_to}")
             return True
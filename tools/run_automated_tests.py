@@ -6,10 +6,13 @@ Comprehensive Automated Testing Suite for Danger Rose
 This script runs all automated tests to detect visual and audio bugs.
 """
 
+import importlib.util
 import json
-import subprocess
 import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -17,6 +20,80 @@ from typing import Any
 # Add tools to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+try:
+    import orjson
+except ImportError:  # optional accelerated JSON
+    orjson = None
+
+from audio_validator import AudioValidator
+from automated_game_tester import AutomatedGameTester
+from visual_regression_tester import VisualRegressionTester
+
+
+@dataclass
+class TestSpec:
+    """One entry in the static test registry."""
+
+    name: str
+    test_class: type
+    method: Callable[..., dict]
+    critical: bool = False
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+# Static registry: direct class and method references resolved at import
+# time instead of __import__/getattr string lookups per run
+TESTS = (
+    TestSpec(
+        "Audio Validation", AudioValidator, AudioValidator.run_validation, critical=True
+    ),
+    TestSpec(
+        "Visual Regression",
+        VisualRegressionTester,
+        VisualRegressionTester.run_visual_tests,
+        critical=True,
+    ),
+    TestSpec(
+        "Game Integration",
+        AutomatedGameTester,
+        AutomatedGameTester.run_automated_test,
+    ),
+)
+
+
+def _execute_test(
+    test: TestSpec, args: dict[str, Any], session_dir: Path, results_dir: Path
+) -> dict[str, Any]:
+    """Construct and run one test; picklable so it can run in a worker."""
+    try:
+        output_dir = session_dir / test.name.lower().replace(" ", "_")
+
+        if test.test_class is AutomatedGameTester:
+            tester = test.test_class(output_dir=str(output_dir))
+        elif test.test_class is VisualRegressionTester:
+            reference_dir = results_dir / "visual_references"
+            reference_dir.mkdir(exist_ok=True)
+            tester = test.test_class(reference_dir=str(reference_dir))
+        else:
+            tester = test.test_class()
+
+        result = test.method(tester, **args)
+
+        return {
+            "details": result,
+            "critical": test.critical,
+        }
+
+    except Exception as e:
+        import traceback
+
+        return {
+            "status": "error",
+            "error": str(e),
+            "traceback": traceback.format_exc(),
+            "critical": test.critical,
+        }
+
 
 class AutomatedTestRunner:
     """Runs all automated tests and generates a comprehensive report."""
@@ -30,6 +107,13 @@ class AutomatedTestRunner:
 
         self.test_results = {}
 
+        # Each finished test is appended here as one JSON line, so a
+        # partial run still leaves a readable record on disk. The handle
+        # has to outlive __init__ for that; run_all_tests closes it.
+        self._results_jsonl = open(  # noqa: SIM115
+            self.session_dir / "test_results.jsonl", "w"
+        )
+
     def run_all_tests(self, quick_mode: bool = False) -> dict[str, Any]:
         """Run all automated tests."""
         print("🤖 DANGER ROSE AUTOMATED TEST SUITE")
@@ -40,55 +124,60 @@ class AutomatedTestRunner:
 
         start_time = time.time()
 
-        # Define test suite
-        tests = [
-            {
-                "name": "Audio Validation",
-                "module": "audio_validator",
-                "class": "AudioValidator",
-                "method": "run_validation",
-                "critical": True,
-            },
-            {
-                "name": "Visual Regression",
-                "module": "visual_regression_tester",
-                "class": "VisualRegressionTester",
-                "method": "run_visual_tests",
-                "critical": True,
-            },
-            {
-                "name": "Game Integration",
-                "module": "automated_game_tester",
-                "class": "AutomatedGameTester",
-                "method": "run_automated_test",
-                "args": {"duration_seconds": 30 if quick_mode else 120},
-                "critical": False,
-            },
-        ]
+        # Per-run arguments layered over the static registry
+        run_args = {
+            "Game Integration": {"duration_seconds": 30 if quick_mode else 120},
+        }
 
-        # Run each test
-        for test in tests:
-            print(f"\n🧪 Running: {test['name']}...")
+        # Audio and Visual touch disjoint file trees, so they run
+        # concurrently in worker processes; Game Integration wants the
+        # display and mixer to itself and runs alone afterwards
+        concurrent_tests = [t for t in TESTS if t.name != "Game Integration"]
+        exclusive_tests = [t for t in TESTS if t.name == "Game Integration"]
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            futures = {}
+            for test in concurrent_tests:
+                print(f"\n🧪 Running: {test.name}...")
+                futures[
+                    pool.submit(
+                        _execute_test,
+                        test,
+                        run_args.get(test.name, test.args),
+                        self.session_dir,
+                        self.results_dir,
+                    )
+                ] = test
+            for future in as_completed(futures):
+                test = futures[future]
+                try:
+                    self._record_result(test, future.result())
+                except Exception as e:
+                    print(f"💥 {test.name} - CRASHED: {str(e)}")
+                    self.test_results[test.name] = {
+                        "status": "crashed",
+                        "error": str(e),
+                        "critical": test.critical,
+                    }
+
+        for test in exclusive_tests:
+            print(f"\n🧪 Running: {test.name}...")
             try:
-                result = self._run_test(test)
-                self.test_results[test["name"]] = result
-
-                # Print immediate feedback
-                if result.get("status") == "passed":
-                    print(f"✅ {test['name']} - PASSED")
-                else:
-                    print(f"❌ {test['name']} - FAILED")
-                    if test.get("critical"):
-                        print(
-                            "⚠️  Critical test failed - subsequent tests may be affected"
-                        )
-
+                self._record_result(
+                    test,
+                    _execute_test(
+                        test,
+                        run_args.get(test.name, test.args),
+                        self.session_dir,
+                        self.results_dir,
+                    ),
+                )
             except Exception as e:
-                print(f"💥 {test['name']} - CRASHED: {str(e)}")
-                self.test_results[test["name"]] = {
+                print(f"💥 {test.name} - CRASHED: {str(e)}")
+                self.test_results[test.name] = {
                     "status": "crashed",
                     "error": str(e),
-                    "critical": test.get("critical", False),
+                    "critical": test.critical,
                 }
 
         # Generate comprehensive report
@@ -96,9 +185,13 @@ class AutomatedTestRunner:
         report = self._generate_comprehensive_report(total_time)
 
         # Save report
+        self._results_jsonl.close()
         report_path = self.session_dir / "comprehensive_report.json"
-        with open(report_path, "w") as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, "w") as f:
+                json.dump(report, f, indent=2)
 
         # Generate HTML report
         self._generate_html_report(report)
@@ -108,80 +201,100 @@ class AutomatedTestRunner:
 
         return report
 
-    def _run_test(self, test_config: dict) -> dict[str, Any]:
-        """Run a single test."""
-        try:
-            # Import test module
-            module = __import__(test_config["module"])
-            test_class = getattr(module, test_config["class"])
-
-            # Create test instance
-            output_dir = self.session_dir / test_config["name"].lower().replace(
-                " ", "_"
-            )
-
-            if test_config["class"] == "AutomatedGameTester":
-                tester = test_class(output_dir=str(output_dir))
-            elif test_config["class"] == "VisualRegressionTester":
-                reference_dir = self.results_dir / "visual_references"
-                reference_dir.mkdir(exist_ok=True)
-                tester = test_class(reference_dir=str(reference_dir))
-            else:
-                tester = test_class()
-
-            # Run test method
-            method = getattr(tester, test_config["method"])
-            args = test_config.get("args", {})
-
-            if args:
-                result = method(**args)
-            else:
-                result = method()
-
-            # Determine pass/fail
-            status = self._determine_test_status(test_config["name"], result)
-
-            return {
-                "status": status,
-                "details": result,
-                "critical": test_config.get("critical", False),
-            }
-
-        except Exception as e:
-            import traceback
-
-            return {
-                "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc(),
-                "critical": test_config.get("critical", False),
+    # Scalar metrics each suite keeps in memory; everything else in a
+    # details dict (screenshots, per-frame samples) goes straight to a
+    # per-test sidecar file so session memory stays flat
+    _DETAIL_KEYS = {
+        "Audio Validation": ("total_issues", "critical_issues"),
+        "Visual Regression": ("total_tests", "total_screenshots", "visual_regressions"),
+        "Game Integration": (
+            "test_duration",
+            "average_fps",
+            "visual_bugs",
+            "audio_bugs",
+            "performance_issues",
+            "crashes",
+        ),
+    }
+
+    @classmethod
+    def _summarize_details(cls, test_name: str, details: dict) -> dict:
+        """Reduce a suite's details to the metrics the reports read."""
+        summary = {
+            key: details.get(key, 0) for key in cls._DETAIL_KEYS.get(test_name, ())
+        }
+        if test_name == "Audio Validation":
+            file_val = details.get("test_results", {}).get("file_validation", {})
+            summary["test_results"] = {
+                "file_validation": {
+                    "total_expected": file_val.get("total_expected", 0),
+                    "found": file_val.get("found", 0),
+                    "missing": file_val.get("missing", []),
+                }
             }
+        return summary
+
+    def _record_result(self, test: TestSpec, outcome: dict[str, Any]) -> None:
+        """Assign a status to a finished test and print feedback."""
+        if "details" in outcome:
+            details = outcome["details"]
+            outcome["status"] = self._determine_test_status(test.name, details)
+
+            # Full details land on disk immediately; memory keeps only
+            # the summary metrics
+            slug = test.name.lower().replace(" ", "_")
+            detail_path = self.session_dir / f"{slug}_details.json"
+            detail_path.write_text(json.dumps(details))
+            outcome["details"] = self._summarize_details(test.name, details)
+            outcome["details_file"] = detail_path.name
+        self.test_results[test.name] = outcome
+
+        self._results_jsonl.write(json.dumps({"name": test.name, **outcome}) + "\n")
+        self._results_jsonl.flush()
+
+        if outcome.get("status") == "passed":
+            print(f"✅ {test.name} - PASSED")
+        else:
+            print(f"❌ {test.name} - FAILED")
+            if test.critical:
+                print("⚠️  Critical test failed - subsequent tests may be affected")
+
+    @staticmethod
+    def _audio_status(result: dict) -> str:
+        if result.get("critical_issues", 0) > 0:
+            return "failed"
+        if result.get("total_issues", 0) > 5:
+            return "warning"
+        return "passed"
+
+    @staticmethod
+    def _visual_status(result: dict) -> str:
+        if result.get("visual_regressions", 0) > 0:
+            return "failed"
+        return "passed"
+
+    @staticmethod
+    def _integration_status(result: dict) -> str:
+        if result.get("crashes", 0) > 0:
+            return "failed"
+        if result.get("visual_bugs", 0) > 5 or result.get("performance_issues", 0) > 10:
+            return "warning"
+        return "passed"
+
+    # Per-suite status rules, dispatched by name instead of chained
+    # string comparisons
+    _STATUS_FN = {
+        "Audio Validation": _audio_status,
+        "Visual Regression": _visual_status,
+        "Game Integration": _integration_status,
+    }
 
     def _determine_test_status(self, test_name: str, result: dict) -> str:
         """Determine if test passed or failed based on results."""
-        if test_name == "Audio Validation":
-            if result.get("critical_issues", 0) > 0:
-                return "failed"
-            if result.get("total_issues", 0) > 5:
-                return "warning"
-            return "passed"
-
-        if test_name == "Visual Regression":
-            if result.get("visual_regressions", 0) > 0:
-                return "failed"
-            return "passed"
-
-        if test_name == "Game Integration":
-            if result.get("crashes", 0) > 0:
-                return "failed"
-            if (
-                result.get("visual_bugs", 0) > 5
-                or result.get("performance_issues", 0) > 10
-            ):
-                return "warning"
-            return "passed"
-
-        return "unknown"
+        status_fn = self._STATUS_FN.get(test_name)
+        if status_fn is None:
+            return "unknown"
+        return status_fn.__func__(result)
 
     def _generate_comprehensive_report(self, total_time: float) -> dict[str, Any]:
         """Generate comprehensive test report."""
@@ -360,19 +473,20 @@ class AutomatedTestRunner:
 
     def _generate_test_results_html(self, test_results: dict) -> str:
         """Generate HTML for test results."""
-        html = ""
+        # Collect fragments and join once instead of growing a string
+        parts = []
 
         for test_name, result in test_results.items():
             status = result.get("status", "unknown")
             status_class = status
 
-            html += f"""
+            parts.append(f"""
             <div class="test-result">
                 <h3>{test_name} - <span class="{status_class}">{status.upper()}</span></h3>
-            """
+            """)
 
             if status == "crashed":
-                html += f"<p>Error: {result.get('error', 'Unknown error')}</p>"
+                parts.append(f"<p>Error: {result.get('error', 'Unknown error')}</p>")
             else:
                 details = result.get("details", {})
 
@@ -380,7 +494,7 @@ class AutomatedTestRunner:
                     file_val = details.get("test_results", {}).get(
                         "file_validation", {}
                     )
-                    html += f"""
+                    parts.append(f"""
                     <table>
                         <tr><th>Metric</th><th>Value</th></tr>
                         <tr><td>Files Expected</td><td>{file_val.get("total_expected", 0)}</td></tr>
@@ -389,20 +503,20 @@ class AutomatedTestRunner:
                         <tr><td>Total Issues</td><td>{details.get("total_issues", 0)}</td></tr>
                         <tr><td>Critical Issues</td><td>{details.get("critical_issues", 0)}</td></tr>
                     </table>
-                    """
+                    """)
 
                 elif test_name == "Visual Regression":
-                    html += f"""
+                    parts.append(f"""
                     <table>
                         <tr><th>Metric</th><th>Value</th></tr>
                         <tr><td>Total Tests</td><td>{details.get("total_tests", 0)}</td></tr>
                         <tr><td>Screenshots</td><td>{details.get("total_screenshots", 0)}</td></tr>
                         <tr><td>Visual Regressions</td><td>{details.get("visual_regressions", 0)}</td></tr>
                     </table>
-                    """
+                    """)
 
                 elif test_name == "Game Integration":
-                    html += f"""
+                    parts.append(f"""
                     <table>
                         <tr><th>Metric</th><th>Value</th></tr>
                         <tr><td>Test Duration</td><td>{details.get("test_duration", 0):.1f}s</td></tr>
@@ -412,11 +526,11 @@ class AutomatedTestRunner:
                         <tr><td>Performance Issues</td><td>{details.get("performance_issues", 0)}</td></tr>
                         <tr><td>Crashes</td><td>{details.get("crashes", 0)}</td></tr>
                     </table>
-                    """
+                    """)
 
-            html += "</div>"
+            parts.append("</div>")
 
-        return html
+        return "".join(parts)
 
     def _print_final_summary(self, report: dict[str, Any]) -> None:
         """Print final test summary."""
@@ -469,38 +583,29 @@ def main():
 
     args = parser.parse_args()
 
-    # Install dependencies if needed
-    try:
-        pass
-    except ImportError:
-        print("Installing required dependencies...")
-        subprocess.check_call(
-            [
-                sys.executable,
-                "-m",
-                "pip",
-                "install",
-                "mutagen",
-                "numpy",
-                "pillow",
-                "scipy",
-            ]
-        )
+    # Fail fast on missing dependencies instead of installing mid-run
+    missing = [
+        module
+        for module in ("mutagen", "numpy", "PIL")
+        if importlib.util.find_spec(module) is None
+    ]
+    # scipy only backs the cv2-less fallback of the missing-sprite
+    # detector, so either library makes the suite runnable
+    if all(importlib.util.find_spec(m) is None for m in ("cv2", "scipy")):
+        missing.append("scipy (or opencv-python)")
+    if missing:
+        sys.exit(f"Missing required packages: {', '.join(missing)} (pip install them)")
 
     runner = AutomatedTestRunner()
 
     if args.visual_only:
         # Run only visual tests
-        from visual_regression_tester import VisualRegressionTester
-
         tester = VisualRegressionTester()
         report = tester.run_visual_tests()
         return 0 if report["visual_regressions"] == 0 else 1
 
     if args.audio_only:
         # Run only audio tests
-        from audio_validator import AudioValidator
-
         validator = AudioValidator()
         report = validator.run_validation()
         return 0 if report["critical_issues"] == 0 else 1
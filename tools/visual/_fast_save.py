@@ -0,0 +1,147 @@
+"""Fast PNG saving for throwaway visual-tool artifacts."""
+
+import hashlib
+import os
+import shutil
+
+import numpy as np
+import pygame
+from PIL import Image
+
+
+def fast_save(surface, path, compress_level=1):
+    """Save a surface as a PNG at low zlib compression.
+
+    These outputs are inspected once and deleted, so encode time matters
+    and file size doesn't. Level 1 is roughly 4x faster than the fixed
+    level 6 inside pygame.image.save; pass level 0 for full-sheet
+    previews to skip deflate entirely.
+    """
+    data = pygame.image.tostring(surface, "RGBA")
+    _encode(data, surface.get_size(), str(path), compress_level)
+
+
+def _encode(data, size, path, compress_level):
+    """PNG-encode one raw RGBA buffer.
+
+    The 1 MiB buffer turns the encoder's stream of small chunk writes
+    into a handful of write syscalls per file.
+    """
+    img = Image.frombytes("RGBA", size, data)
+    with open(path, "wb", buffering=1 << 20) as f:
+        img.save(f, "PNG", optimize=False, compress_level=compress_level)
+
+
+def snapshot_save(pool, futures, surface, path, compress_level=1):
+    """Capture pixels now, encode on a worker.
+
+    For surfaces the caller mutates or reuses immediately after saving;
+    plain fast_save submitted to a pool would race the reuse.
+    """
+    data = pygame.image.tostring(surface, "RGBA")
+    futures.append(
+        pool.submit(_encode, data, surface.get_size(), str(path), compress_level)
+    )
+
+
+# Pixel digest -> (encode future, first path written for that content)
+_seen = {}
+
+
+def dedup_save(pool, futures, surface, path, compress_level=1):
+    """Submit a save, hardlinking paths whose pixels were already encoded.
+
+    The fix-comparison tools re-emit identical sheet regions under
+    several names; hashing the raw pixels lets every repeat become a
+    hardlink (or copy, on filesystems without link support) instead of
+    another PNG encode.
+    """
+    digest = hashlib.blake2b(
+        pygame.image.tostring(surface, "RGBA"), digest_size=16
+    ).digest()
+    first = _seen.get(digest)
+    if first is None:
+        future = pool.submit(fast_save, surface, path, compress_level)
+        _seen[digest] = (future, str(path))
+        futures.append(future)
+    else:
+        futures.append(pool.submit(_link_duplicate, *first, str(path)))
+
+
+# Pixel digest -> (encode future, first full/thumbnail paths written)
+_seen_pairs = {}
+
+
+def dedup_save_pair(pool, futures, surface, path, thumb_path, thumb_size=(128, 128)):
+    """Save a frame plus its thumbnail from one pixel capture.
+
+    One tostring feeds both encodes, so the pygame.transform.scale
+    Surface round-trip disappears and the thumbnail gets a proper
+    Lanczos downscale instead of nearest-neighbor. Duplicate content is
+    hardlinked like dedup_save.
+    """
+    data = pygame.image.tostring(surface, "RGBA")
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    first = _seen_pairs.get(digest)
+    if first is None:
+        future = pool.submit(
+            _encode_pair, data, surface.get_size(), str(path), str(thumb_path), thumb_size
+        )
+        _seen_pairs[digest] = (future, str(path), str(thumb_path))
+        futures.append(future)
+    else:
+        src_future, src_path, src_thumb = first
+        futures.append(pool.submit(_link_duplicate, src_future, src_path, str(path)))
+        futures.append(
+            pool.submit(_link_duplicate, src_future, src_thumb, str(thumb_path))
+        )
+
+
+def _encode_pair(data, size, path, thumb_path, thumb_size):
+    """PNG-encode one frame and its thumbnail (runs on a worker thread)."""
+    img = Image.frombytes("RGBA", size, data)
+    with open(path, "wb", buffering=1 << 20) as f:
+        img.save(f, "PNG", optimize=False, compress_level=1)
+    thumb = img.resize(thumb_size, Image.LANCZOS)
+    with open(thumb_path, "wb", buffering=1 << 20) as f:
+        thumb.save(f, "PNG", optimize=False, compress_level=1)
+
+
+def _link_duplicate(src_future, src_path, path):
+    """Link ``path`` to already-encoded content once its save finishes."""
+    src_future.result()
+    if os.path.exists(path):
+        os.remove(path)
+    try:
+        os.link(src_path, path)
+    except OSError:
+        shutil.copyfile(src_path, path)
+
+
+def grid_array(sheet):
+    """Snapshot a sheet's pixels as one (height, width, 4) uint8 array."""
+    width, height = sheet.get_size()
+    raw = pygame.image.tostring(sheet, "RGBA")
+    return np.frombuffer(raw, np.uint8).reshape(height, width, 4)
+
+
+def encode_tiles(pool, futures, arr, jobs, compress_level=1):
+    """Encode rectangular tiles of a grid_array snapshot.
+
+    Each job is ``((x, y, w, h), path)``. Tiles are slices of the shared
+    snapshot, so the per-frame Python work collapses to indexing plus
+    the worker-side PNG encode — no Surface or subsurface round-trips.
+    """
+    for (x, y, w, h), path in jobs:
+        futures.append(
+            pool.submit(
+                _encode_array, arr[y : y + h, x : x + w], str(path), compress_level
+            )
+        )
+
+
+def _encode_array(tile, path, compress_level):
+    """PNG-encode one RGBA ndarray tile (runs on a worker thread)."""
+    img = Image.fromarray(tile, "RGBA")
+    with open(path, "wb", buffering=1 << 20) as f:
+        img.save(f, "PNG", optimize=False, compress_level=compress_level)
@@ -0,0 +1,57 @@
+"""Shared decoded sprite-sheet cache for the visual tools."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Dummy video keeps CI from opening real windows; set before pygame
+# touches SDL
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+# One SDL init for every tool that imports this module; the hidden
+# display gives convert_alpha a format to target
+pygame.init()
+pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+
+@lru_cache(maxsize=None)
+def load_sheet(path):
+    """Load a sprite sheet once per path per process.
+
+    Every tool in this directory reads the same character sheets; the
+    cache limits the multi-MB PNG inflate to one decode per sheet no
+    matter how many tests run in the process. The tools only slice and
+    re-save the pixels, so the sheet stays in its native RGBA format —
+    no convert_alpha pass over the whole image.
+    """
+    return pygame.image.load(str(path))
+
+
+def warmup(paths):
+    """Decode several sheets concurrently to pre-fill load_sheet's cache.
+
+    libpng's inflate releases the GIL, so the danger and rose decodes
+    overlap on a small thread pool instead of running back to back.
+    With fork-based worker pools the warmed cache is inherited
+    copy-on-write, so the children skip the decode entirely. Missing
+    files are skipped, matching the tools' own existence checks.
+    """
+    paths = [p for p in paths if os.path.exists(str(p))]
+    if not paths:
+        return
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        list(pool.map(load_sheet, paths))
+
+
+@lru_cache(maxsize=1024)
+def extract(sheet, x, y, w, h):
+    """Memoized zero-copy view of one sheet region.
+
+    Surfaces hash by identity, so every repeat of the same slice — the
+    fix-comparison tools all cut the y=682 attack row, some twice under
+    different method names — returns the cached subsurface instead of
+    constructing a fresh one.
+    """
+    return sheet.subsurface((x, y, w, h))
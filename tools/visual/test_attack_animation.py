@@ -1,3 +1,4 @@
+import io
 import pygame
 import sys
 import os
@@ -6,32 +7,53 @@ from pathlib import Path
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from PIL import Image
+
+from _sheet_cache import load_sheet, warmup
 from utils.asset_paths import get_danger_sprite, get_rose_sprite
 
 
+def _save_png(surface, path):
+    """Save a surface as a fast, lightly compressed PNG.
+
+    These artifacts are inspected once and deleted, so zlib level 1
+    (roughly 4x faster than pygame's default level 6) is the right
+    trade; Pillow exposes the knob, pygame.image.save does not.
+    """
+    data = pygame.image.tostring(surface, "RGBA")
+    Image.frombytes("RGBA", surface.get_size(), data).save(
+        path, "PNG", optimize=False, compress_level=1
+    )
+
+
 def test_attack_animation_cutting():
     """Test cutting just the attack animation (row 2) from sprite sheets."""
-    pygame.init()
-
     output_dir = Path(__file__).parent.parent / "test-artifacts" / "attack_output"
     output_dir.mkdir(exist_ok=True)
 
+    # Decode both sheets concurrently before the serial loop needs them
+    warmup([get_danger_sprite(), get_rose_sprite()])
+
+    # Accumulate all progress output and write it once at the end; with
+    # stdout on a pipe or terminal every print is otherwise a syscall
+    out = io.StringIO()
+
     for character_name, sprite_path in [
         ("danger", get_danger_sprite()),
         ("rose", get_rose_sprite()),
     ]:
         if not os.path.exists(sprite_path):
-            print(f"Skipping {character_name} - file not found")
+            print(f"Skipping {character_name} - file not found", file=out)
             continue
 
-        print(f"\n=== TESTING {character_name.upper()} ATTACK ANIMATION ===")
+        print(f"\n=== TESTING {character_name.upper()} ATTACK ANIMATION ===", file=out)
 
-        # Load the original sprite sheet
-        sheet = pygame.image.load(sprite_path)
+        # Load the original sprite sheet once per character
+        sheet = load_sheet(sprite_path)
         sheet_width = sheet.get_width()
         sheet_height = sheet.get_height()
 
-        print(f"Sheet dimensions: {sheet_width}x{sheet_height}")
+        print(f"Sheet dimensions: {sheet_width}x{sheet_height}", file=out)
 
         # Test different frame sizes for attack animation (row 2)
         frame_sizes = [
@@ -43,7 +65,7 @@ def test_attack_animation_cutting():
         ]
 
         for frame_width, frame_height in frame_sizes:
-            print(f"\nTesting frame size: {frame_width}x{frame_height}")
+            print(f"\nTesting frame size: {frame_width}x{frame_height}", file=out)
 
             # Create directory for this test
             test_dir = (
@@ -58,11 +80,15 @@ def test_attack_animation_cutting():
             # Check if row fits in sheet
             if y_start + frame_height > sheet_height:
                 print(
-                    f"  Row 2 doesn't fit: {y_start} + {frame_height} = {y_start + frame_height} > {sheet_height}"
+                    f"  Row 2 doesn't fit: {y_start} + {frame_height} = {y_start + frame_height} > {sheet_height}",
+                    file=out,
                 )
                 continue
 
-            print(f"  Row 2 starts at y={y_start}")
+            print(f"  Row 2 starts at y={y_start}", file=out)
+
+            # Cut the whole attack row out once; frames come from it
+            row_strip = sheet.subsurface((0, y_start, sheet_width, frame_height))
 
             # Extract frames from row 2
             frames_extracted = 0
@@ -72,22 +98,23 @@ def test_attack_animation_cutting():
                 # Check if column fits in sheet
                 if x_start + frame_width > sheet_width:
                     print(
-                        f"    Column {col} doesn't fit: {x_start} + {frame_width} = {x_start + frame_width} > {sheet_width}"
+                        f"    Column {col} doesn't fit: {x_start} + {frame_width} = {x_start + frame_width} > {sheet_width}",
+                        file=out,
                     )
                     break
 
-                # Extract frame
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), (x_start, y_start, frame_width, frame_height))
+                # Extract frame as a zero-copy view; image.save accepts
+                # subsurfaces directly, so no allocation or blit needed
+                frame = row_strip.subsurface((x_start, 0, frame_width, frame_height))
 
                 # Save frame
                 frame_filename = f"attack_frame_{col}.png"
-                pygame.image.save(frame, str(test_dir / frame_filename))
+                _save_png(frame, str(test_dir / frame_filename))
 
                 frames_extracted += 1
-                print(f"    Extracted frame {col} from ({x_start}, {y_start})")
+                print(f"    Extracted frame {col} from ({x_start}, {y_start})", file=out)
 
-            print(f"  Total frames extracted: {frames_extracted}")
+            print(f"  Total frames extracted: {frames_extracted}", file=out)
 
             # Also save a visualization of the row boundary
             if frames_extracted > 0:
@@ -97,7 +124,9 @@ def test_attack_animation_cutting():
                 pygame.draw.rect(
                     viz, (255, 0, 0), (0, y_start, sheet_width, frame_height), 3
                 )
-                pygame.image.save(viz, str(test_dir / "row_visualization.png"))
+                _save_png(viz, str(test_dir / "row_visualization.png"))
+
+    sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":
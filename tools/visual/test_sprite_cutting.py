@@ -1,20 +1,111 @@
 import pygame
 import sys
+import multiprocessing
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from _fast_save import encode_tiles, fast_save, grid_array
+from _sheet_cache import extract, load_sheet, warmup
+
 from utils.asset_paths import get_danger_sprite, get_rose_sprite
 from utils.sprite_loader import load_character_animations
 
 
+def _cut_character(character_name, sprite_path, output_dir):
+    """Cut every candidate frame size for one character (worker process)."""
+    if not os.path.exists(sprite_path):
+        print(f"Skipping {character_name} - file not found")
+        return
+
+    # PNG encoding releases the GIL inside zlib, so saves overlap on
+    # worker threads while the loop keeps extracting
+    pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    futures = []
+
+    print(f"\n=== CUTTING {character_name.upper()} SPRITE SHEET ===")
+
+    # Load the original sprite sheet
+    original_sheet = load_sheet(sprite_path)
+    sheet_width = original_sheet.get_width()
+    sheet_height = original_sheet.get_height()
+
+    print(f"Original sheet: {sheet_width}x{sheet_height}")
+
+    # Save original sheet for reference
+    futures.append(
+        pool.submit(
+            fast_save,
+            original_sheet,
+            str(output_dir / f"{character_name}_original.png"),
+            0,
+        )
+    )
+
+    # Test different frame sizes
+    frame_sizes = [
+        (64, 64),  # Current assumption
+        (32, 32),  # Smaller
+        (48, 48),  # Medium
+        (
+            sheet_width // 4,
+            sheet_height // 3,
+        ),  # Calculated based on 4 cols, 3 rows
+        (
+            sheet_width // 3,
+            sheet_height // 3,
+        ),  # Calculated based on 3 cols, 3 rows
+    ]
+
+    # One mkdir pass for all frame-size directories up front
+    for frame_width, frame_height in frame_sizes:
+        (
+            output_dir / f"{character_name}_{frame_width}x{frame_height}"
+        ).mkdir(parents=True, exist_ok=True)
+
+    for frame_width, frame_height in frame_sizes:
+        print(f"\nTesting frame size: {frame_width}x{frame_height}")
+
+        frame_dir = (
+            output_dir / f"{character_name}_{frame_width}x{frame_height}"
+        )
+
+        # Cut sprites using current logic; the ranges are
+        # clamped to the sheet up front, so no per-tile bounds
+        # check is needed
+        frame_count = 0
+        max_rows = min(3, sheet_height // frame_height)
+        max_cols = min(4, sheet_width // frame_width)
+        for row in range(max_rows):
+            for col in range(max_cols):
+                x = col * frame_width
+                y = row * frame_height
+
+                # Extract frame as a memoized zero-copy view of the
+                # sheet
+                frame = extract(original_sheet, x, y, frame_width, frame_height)
+
+                # Save frame
+                frame_filename = f"row{row}_col{col}_frame{frame_count}.png"
+                futures.append(pool.submit(fast_save, frame, str(frame_dir / frame_filename)))
+
+                frame_count += 1
+
+        print(
+            f"Generated {frame_count} frames for {frame_width}x{frame_height}"
+        )
+
+    wait(futures)
+    pool.shutdown()
+
+
 class TestSpriteCutting:
     @classmethod
     def setup_class(cls):
-        """Initialize pygame for testing."""
-        pygame.init()
+        """Initialize pygame for testing (done once by _sheet_cache)."""
 
     def test_sprite_sheet_dimensions(self):
         """Test to understand the actual sprite sheet dimensions."""
@@ -30,103 +121,45 @@ class TestSpriteCutting:
         print(f"Rose file exists: {os.path.exists(rose_path)}")
 
         if os.path.exists(danger_path):
-            danger_sheet = pygame.image.load(danger_path)
+            danger_sheet = load_sheet(danger_path)
             print(
                 f"Danger sheet dimensions: {danger_sheet.get_width()}x{danger_sheet.get_height()}"
             )
 
         if os.path.exists(rose_path):
-            rose_sheet = pygame.image.load(rose_path)
+            rose_sheet = load_sheet(rose_path)
             print(
                 f"Rose sheet dimensions: {rose_sheet.get_width()}x{rose_sheet.get_height()}"
             )
 
     def test_sprite_cutting_visualization(self):
         """Generate individual sprite images to visualize how they're being cut."""
-        danger_path = get_danger_sprite()
-        rose_path = get_rose_sprite()
-
         # Create output directory for test images
         output_dir = Path(__file__).parent.parent / "test-artifacts" / "sprite_output"
         output_dir.mkdir(exist_ok=True)
 
-        for character_name, sprite_path in [
-            ("danger", danger_path),
-            ("rose", rose_path),
-        ]:
-            if not os.path.exists(sprite_path):
-                print(f"Skipping {character_name} - file not found")
-                continue
-
-            print(f"\n=== CUTTING {character_name.upper()} SPRITE SHEET ===")
-
-            # Load the original sprite sheet
-            original_sheet = pygame.image.load(sprite_path)
-            sheet_width = original_sheet.get_width()
-            sheet_height = original_sheet.get_height()
-
-            print(f"Original sheet: {sheet_width}x{sheet_height}")
-
-            # Save original sheet for reference
-            pygame.image.save(
-                original_sheet, str(output_dir / f"{character_name}_original.png")
+        characters = [
+            ("danger", get_danger_sprite()),
+            ("rose", get_rose_sprite()),
+        ]
+
+        # Decode both sheets concurrently up front; the forked workers
+        # inherit the warm cache copy-on-write
+        warmup([path for _, path in characters])
+
+        # The characters are independent after sheet load, so each gets
+        # its own worker process; children inherit the dummy-driver SDL
+        # init
+        with multiprocessing.Pool(len(characters)) as procs:
+            procs.starmap(
+                _cut_character,
+                [(name, path, output_dir) for name, path in characters],
             )
+            # Drain before __exit__; terminate() can SIGTERM a worker
+            # that holds the task-queue lock and deadlock the survivors
+            procs.close()
+            procs.join()
 
-            # Test different frame sizes
-            frame_sizes = [
-                (64, 64),  # Current assumption
-                (32, 32),  # Smaller
-                (48, 48),  # Medium
-                (
-                    sheet_width // 4,
-                    sheet_height // 3,
-                ),  # Calculated based on 4 cols, 3 rows
-                (
-                    sheet_width // 3,
-                    sheet_height // 3,
-                ),  # Calculated based on 3 cols, 3 rows
-            ]
-
-            for frame_width, frame_height in frame_sizes:
-                print(f"\nTesting frame size: {frame_width}x{frame_height}")
-
-                # Create output directory for this frame size
-                frame_dir = (
-                    output_dir / f"{character_name}_{frame_width}x{frame_height}"
-                )
-                frame_dir.mkdir(exist_ok=True)
-
-                # Cut sprites using current logic
-                frame_count = 0
-                for row in range(3):  # 3 rows
-                    for col in range(4):  # Assume 4 columns max
-                        x = col * frame_width
-                        y = row * frame_height
-
-                        # Skip if we'd go outside the sheet
-                        if (
-                            x + frame_width > sheet_width
-                            or y + frame_height > sheet_height
-                        ):
-                            continue
-
-                        # Extract frame
-                        frame = pygame.Surface(
-                            (frame_width, frame_height), pygame.SRCALPHA
-                        )
-                        frame.blit(
-                            original_sheet, (0, 0), (x, y, frame_width, frame_height)
-                        )
-
-                        # Save frame
-                        frame_filename = f"row{row}_col{col}_frame{frame_count}.png"
-                        pygame.image.save(frame, str(frame_dir / frame_filename))
-
-                        frame_count += 1
-
-                print(
-                    f"Generated {frame_count} frames for {frame_width}x{frame_height}"
-                )
 
     def test_current_animation_loading(self):
         """Test the current animation loading system."""
@@ -177,7 +210,7 @@ class TestSpriteCutting:
                 print(f"Skipping {character_name} - file not found")
                 continue
 
-            sheet = pygame.image.load(sprite_path)
+            sheet = load_sheet(sprite_path)
             width, height = sheet.get_width(), sheet.get_height()
 
             print(f"\n{character_name.upper()} sprite sheet: {width}x{height}")
@@ -1,129 +1,178 @@
 import pygame
 import sys
+import multiprocessing
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
+import numpy as np
+
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from utils.asset_paths import get_danger_sprite, get_rose_sprite
-
-
-def test_sprite_sheet_layout():
-    """Test different ways to cut the sprite sheet to find correct positioning."""
-    pygame.init()
-    screen = pygame.display.set_mode((100, 100))
-
-    output_dir = Path(__file__).parent.parent / "test-artifacts" / "sprite_layout_test"
-    output_dir.mkdir(exist_ok=True)
+from _fast_save import encode_tiles, grid_array, snapshot_save
+from _sheet_cache import load_sheet, warmup
 
-    for character_name, sprite_path in [
-        ("danger", get_danger_sprite()),
-        ("rose", get_rose_sprite()),
-    ]:
-        if not os.path.exists(sprite_path):
-            continue
-
-        print(f"\n=== ANALYZING {character_name.upper()} SPRITE SHEET ===")
+from utils.asset_paths import get_danger_sprite, get_rose_sprite
 
-        sheet = pygame.image.load(sprite_path).convert_alpha()
-        sheet_width = sheet.get_width()
-        sheet_height = sheet.get_height()
 
-        print(f"Sheet dimensions: {sheet_width}x{sheet_height}")
+# Grid layouts to analyze, shared by the driver and the workers
+TEST_CASES = [
+    {"rows": 3, "cols": 4, "description": "3 rows x 4 cols"},
+    {"rows": 4, "cols": 4, "description": "4 rows x 4 cols"},
+    {"rows": 4, "cols": 3, "description": "4 rows x 3 cols"},
+]
 
-        # Save original sheet with grid overlay
-        original_with_grid = sheet.copy()
 
-        # Test different grid layouts
-        test_cases = [
-            {"rows": 3, "cols": 4, "description": "3 rows x 4 cols"},
-            {"rows": 4, "cols": 4, "description": "4 rows x 4 cols"},
-            {"rows": 4, "cols": 3, "description": "4 rows x 3 cols"},
-        ]
+def _process_character(character_name, sprite_path, output_dir):
+    """Analyze every grid layout for one character (worker process)."""
+    if not os.path.exists(sprite_path):
+        return
 
-        for test_case in test_cases:
-            rows = test_case["rows"]
-            cols = test_case["cols"]
-            description = test_case["description"]
+    # PNG encoding releases the GIL inside zlib, so saves overlap on
+    # worker threads while the loop keeps extracting
+    pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    futures = []
 
-            frame_width = sheet_width // cols
-            frame_height = sheet_height // rows
+    print(f"\n=== ANALYZING {character_name.upper()} SPRITE SHEET ===")
 
-            print(f"\nTesting {description}")
-            print(f"  Frame size: {frame_width}x{frame_height}")
+    sheet = load_sheet(sprite_path)
+    sheet_width = sheet.get_width()
+    sheet_height = sheet.get_height()
 
-            # Create test directory
-            test_dir = output_dir / f"{character_name}_{rows}x{cols}"
-            test_dir.mkdir(exist_ok=True)
+    print(f"Sheet dimensions: {sheet_width}x{sheet_height}")
 
-            # Draw grid on original sheet
-            grid_sheet = sheet.copy()
-            for row in range(rows + 1):
-                y = row * frame_height
-                if y < sheet_height:
-                    pygame.draw.line(
-                        grid_sheet, (255, 0, 0), (0, y), (sheet_width, y), 2
-                    )
+    # One reusable overlay surface per sheet; each test case
+    # resets it with a blit instead of a fresh sheet.copy()
+    scratch = sheet.copy()
 
-            for col in range(cols + 1):
-                x = col * frame_width
-                if x < sheet_width:
-                    pygame.draw.line(
-                        grid_sheet, (255, 0, 0), (x, 0), (x, sheet_height), 2
-                    )
+    # One pixel snapshot of the sheet feeds every grid below
+    sheet_pixels = grid_array(sheet)
 
-            pygame.image.save(grid_sheet, str(test_dir / "grid_overlay.png"))
+    for test_case in TEST_CASES:
+        rows = test_case["rows"]
+        cols = test_case["cols"]
+        description = test_case["description"]
 
-            # Extract all frames
-            frame_count = 0
-            for row in range(rows):
-                for col in range(cols):
-                    x = col * frame_width
-                    y = row * frame_height
+        frame_width = sheet_width // cols
+        frame_height = sheet_height // rows
 
-                    # Extract frame
-                    frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), (x, y, frame_width, frame_height))
+        print(f"\nTesting {description}")
+        print(f"  Frame size: {frame_width}x{frame_height}")
 
-                    # Save frame
-                    frame_filename = f"row{row}_col{col}.png"
-                    pygame.image.save(frame, str(test_dir / frame_filename))
+        test_dir = output_dir / f"{character_name}_{rows}x{cols}"
 
-                    frame_count += 1
-                    print(f"    Extracted row {row}, col {col} from ({x}, {y})")
+        # Draw grid on the reset scratch surface: two bulk NumPy
+        # stores instead of one draw.line call per gridline. pixels3d
+        # is (x, y) indexed and keeps the surface locked until the
+        # view is deleted; each line is 2px wide like the old draw
+        scratch.blit(sheet, (0, 0))
+        grid_sheet = scratch
+        arr = pygame.surfarray.pixels3d(grid_sheet)
+        ys = np.arange(rows + 1) * frame_height
+        ys = np.concatenate((ys, ys + 1))
+        arr[:, ys[ys < sheet_height], :] = (255, 0, 0)
+        xs = np.arange(cols + 1) * frame_width
+        xs = np.concatenate((xs, xs + 1))
+        arr[xs[xs < sheet_width], :, :] = (255, 0, 0)
+        del arr
 
-            print(f"  Total frames: {frame_count}")
+        snapshot_save(pool, futures, grid_sheet, str(test_dir / "grid_overlay.png"), 0)
 
-            # Specifically highlight what would be the "attack" row (row 2)
-            if rows > 2:
-                attack_row = 2
-                attack_y = attack_row * frame_height
+        # Extract all frames as slices of the shared snapshot
+        frame_count = 0
+        jobs = []
+        for row in range(rows):
+            for col in range(cols):
+                x = col * frame_width
+                y = row * frame_height
 
-                # Create attack row visualization
-                attack_viz = sheet.copy()
-                pygame.draw.rect(
-                    attack_viz, (0, 255, 0), (0, attack_y, sheet_width, frame_height), 4
-                )
-                pygame.image.save(
-                    attack_viz, str(test_dir / "attack_row_highlight.png")
+                frame_filename = f"row{row}_col{col}.png"
+                jobs.append(
+                    ((x, y, frame_width, frame_height), test_dir / frame_filename)
                 )
 
-                print(f"  Attack row {attack_row} would be at y={attack_y}")
+                frame_count += 1
+                print(f"    Extracted row {row}, col {col} from ({x}, {y})")
+        encode_tiles(pool, futures, sheet_pixels, jobs)
+
+        print(f"  Total frames: {frame_count}")
+
+        # Specifically highlight what would be the "attack" row (row 2)
+        if rows > 2:
+            attack_row = 2
+            attack_y = attack_row * frame_height
+
+            # Create attack row visualization on the scratch surface
+            scratch.blit(sheet, (0, 0))
+            attack_viz = scratch
+            pygame.draw.rect(
+                attack_viz, (0, 255, 0), (0, attack_y, sheet_width, frame_height), 4
+            )
+            snapshot_save(
+                pool,
+                futures,
+                attack_viz,
+                str(test_dir / "attack_row_highlight.png"),
+                0,
+            )
+
+            print(f"  Attack row {attack_row} would be at y={attack_y}")
+
+            # Extract just the attack row frames
+            attack_dir = test_dir / "attack_frames"
+
+            encode_tiles(
+                pool,
+                futures,
+                sheet_pixels,
+                [
+                    (
+                        (col * frame_width, attack_y, frame_width, frame_height),
+                        attack_dir / f"attack_col{col}.png",
+                    )
+                    for col in range(cols)
+                ],
+            )
+
+    wait(futures)
+    pool.shutdown()
 
-                # Extract just the attack row frames
-                attack_dir = test_dir / "attack_frames"
-                attack_dir.mkdir(exist_ok=True)
 
-                for col in range(cols):
-                    x = col * frame_width
-                    y = attack_y
+def test_sprite_sheet_layout():
+    """Test different ways to cut the sprite sheet to find correct positioning."""
+    output_dir = Path(__file__).parent.parent / "test-artifacts" / "sprite_layout_test"
+    output_dir.mkdir(exist_ok=True)
 
-                    frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), (x, y, frame_width, frame_height))
+    characters = [
+        ("danger", get_danger_sprite()),
+        ("rose", get_rose_sprite()),
+    ]
+
+    # Decode both sheets concurrently up front; the forked workers
+    # inherit the warm cache copy-on-write
+    warmup([path for _, path in characters])
+
+    # Create every output directory in one pass (attack_frames implies
+    # its parents); the loops below never touch mkdir again
+    for name, _ in characters:
+        for case in TEST_CASES:
+            (
+                output_dir / f"{name}_{case['rows']}x{case['cols']}" / "attack_frames"
+            ).mkdir(parents=True, exist_ok=True)
+
+    # The characters are independent after sheet load, so each gets its
+    # own worker process; children inherit the dummy-driver SDL init
+    with multiprocessing.Pool(len(characters)) as procs:
+        procs.starmap(
+            _process_character,
+            [(name, path, output_dir) for name, path in characters],
+        )
+        # Drain before __exit__; terminate() can SIGTERM a worker that
+        # holds the task-queue lock and deadlock the survivors
+        procs.close()
+        procs.join()
 
-                    frame_filename = f"attack_col{col}.png"
-                    pygame.image.save(frame, str(attack_dir / frame_filename))
 
 
 if __name__ == "__main__":
@@ -8,9 +8,12 @@ and common rendering bugs in the game.
 
 import json
 import os
+import struct
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path
@@ -18,11 +21,123 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import numpy as np
 import pygame
-from PIL import Image, ImageChops, ImageStat
+from PIL import Image
+
+try:
+    import cv2
+except ImportError:  # OpenCV is optional; PIL + NumPy cover the same ops
+    cv2 = None
+
+try:
+    import numba
+except ImportError:  # Numba is optional; NumPy covers the same math
+    numba = None
 
 # Set headless mode
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 
+# The bug detectors are coarse heuristics; they run on a frame
+# downsampled by this factor, cutting their memory traffic 16x
+_DOWNSAMPLE = 4
+
+
+def _read_image(path) -> np.ndarray:
+    """Decode an image file straight to a uint8 array.
+
+    OpenCV's decoder and SIMD kernels beat the PIL route when cv2 is
+    installed. It returns BGR rather than RGB, but every consumer here
+    works on thresholds and magnitudes that don't care about channel
+    order.
+    """
+    if cv2 is not None:
+        return cv2.imread(str(path), cv2.IMREAD_COLOR)
+    img = Image.open(path)
+    if img.mode != "RGB":
+        # Drop alpha: it's constant for pygame captures and would cost
+        # a third more bandwidth in every diff and detector pass
+        img = img.convert("RGB")
+    return np.asarray(img)
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _edge_nonblack_fraction(edge):
+        """Fraction of edge-band pixels with any channel above 50.
+
+        Compiled per-pixel loop: no slice temporaries, and the uint8
+        compares autovectorize. The first call pays a cached compile;
+        the rest of the run is native code.
+        """
+        rows, cols = edge.shape[0], edge.shape[1]
+        count = 0
+        for i in range(rows):
+            for j in range(cols):
+                if edge[i, j, 0] > 50 or edge[i, j, 1] > 50 or edge[i, j, 2] > 50:
+                    count += 1
+        return count / (rows * cols)
+
+else:
+
+    def _edge_nonblack_fraction(edge: np.ndarray) -> float:
+        """Fraction of edge-band pixels with any channel above 50."""
+        return float(np.any(edge[:, :, :3] > 50, axis=2).mean())
+
+
+def _png_size(path) -> tuple[int, int]:
+    """Read (width, height) straight from a PNG's IHDR, no decode."""
+    with open(path, "rb") as f:
+        header = f.read(24)
+    return struct.unpack(">II", header[16:24])
+
+
+@lru_cache(maxsize=64)
+def _load_reference(path: str) -> np.ndarray:
+    """Decode a reference image once per run.
+
+    References are shared across screenshots and runs of the same
+    suite; caching turns every repeat comparison's decode into a dict
+    lookup. The cached array is shared — callers must not mutate it.
+    """
+    return _read_image(path)
+
+
+def _absdiff(a: np.ndarray, b: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Per-element absolute difference of two uint8 arrays.
+
+    ``out``, when given, receives the result so callers can reuse one
+    buffer across many comparisons instead of allocating per call.
+    """
+    if cv2 is not None:
+        return cv2.absdiff(a, b, dst=out)
+    diff = np.abs(a.astype(np.int16) - b)
+    if out is None:
+        return diff.astype(np.uint8)
+    np.copyto(out, diff, casting="unsafe")
+    return out
+
+
+def _write_image(path, array: np.ndarray) -> None:
+    """Encode a uint8 array to an image file."""
+    if cv2 is not None:
+        cv2.imwrite(str(path), array)
+    else:
+        Image.fromarray(array).save(path)
+
+
+def _write_png(array: np.ndarray, path) -> None:
+    """Encode one captured RGB frame to PNG (runs on a worker thread).
+
+    Per-run captures are rarely viewed, so they get zlib level 1 —
+    roughly 4x faster than the default level 6 for slightly larger
+    files. References stay byte-for-byte copies of these captures, so
+    the format remains plain PNG.
+    """
+    if cv2 is not None:
+        cv2.imwrite(str(path), array[..., ::-1], [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    else:
+        Image.fromarray(array).save(str(path), "PNG", optimize=False, compress_level=1)
+
 
 @dataclass
 class VisualRegression:
@@ -45,6 +160,15 @@ class VisualRegressionTester:
         self.reference_dir = Path(reference_dir)
         self.reference_dir.mkdir(exist_ok=True)
 
+        # Reference dimensions live in a sidecar manifest so a size
+        # mismatch is caught with a dict lookup instead of a decode
+        self._manifest_path = self.reference_dir / "manifest.json"
+        try:
+            with open(self._manifest_path) as f:
+                self._reference_sizes = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._reference_sizes = {}
+
         self.results_dir = Path("visual_test_results")
         self.results_dir.mkdir(exist_ok=True)
 
@@ -56,6 +180,21 @@ class VisualRegressionTester:
         self.regressions: list[VisualRegression] = []
         self.test_cases: dict[str, list[str]] = {}
 
+        # Raw pixels of every captured screenshot, keyed by capture
+        # name; in-process analysis works on these instead of
+        # re-decoding the PNGs written for archival
+        self.screenshot_arrays: dict[str, np.ndarray] = {}
+
+        # PNG encoding happens on worker threads (libpng releases the
+        # GIL), overlapping with the next scene update. Anything that
+        # reads a screenshot file waits on its pending save first
+        self._save_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_saves: dict[str, Future] = {}
+
+        # One diff buffer serves every comparison (all screenshots in a
+        # run share a resolution), sparing a ~1.4 MB malloc per call
+        self._diff_buf: np.ndarray | None = None
+
         # Visual bug detection patterns
         self.bug_patterns = {
             "missing_sprite": self._detect_missing_sprite,
@@ -119,6 +258,22 @@ class VisualRegressionTester:
         # Generate report
         return self._generate_report(results)
 
+    def _stabilize(
+        self, scene_manager, screen: pygame.Surface, frames: int = 10
+    ) -> None:
+        """Advance and redraw a scene until its state settles.
+
+        Every test paid this update+draw loop per screenshot even when
+        the scene hadn't changed; hoisting it lets a scene stabilize
+        once and then serve several captures.
+        """
+        # No display.flip: the dummy SDL driver presents nothing, and
+        # captures read the draw surface directly
+        for _ in range(frames):
+            scene_manager.update(0.016)
+            screen.fill((0, 0, 0))
+            scene_manager.draw(screen)
+
     def _test_title_screen(self, screen: pygame.Surface, scene_manager) -> dict:
         """Test title screen rendering."""
         results = {"screenshots": {}}
@@ -127,11 +282,7 @@ class VisualRegressionTester:
         scene_manager.switch_scene("title")
 
         # Wait for scene to stabilize
-        for _ in range(10):
-            scene_manager.update(0.016)
-            screen.fill((0, 0, 0))
-            scene_manager.draw(screen)
-            pygame.display.flip()
+        self._stabilize(scene_manager, screen)
 
         # Capture screenshots
         screenshots = [
@@ -168,11 +319,7 @@ class VisualRegressionTester:
                 scene_manager.handle_event(event)
 
             # Update and capture
-            for _ in range(5):
-                scene_manager.update(0.016)
-                screen.fill((0, 0, 0))
-                scene_manager.draw(screen)
-                pygame.display.flip()
+            self._stabilize(scene_manager, screen, frames=5)
 
             path = self._capture_screenshot(screen, f"character_select_{character}")
             results["screenshots"][f"select_{character}"] = path
@@ -195,14 +342,11 @@ class VisualRegressionTester:
             ("hub_vegas_door", 600, 300),
         ]
 
-        for name, x, y in test_positions:
-            # Update scene
-            for _ in range(10):
-                scene_manager.update(0.016)
-                screen.fill((0, 0, 0))
-                scene_manager.draw(screen)
-                pygame.display.flip()
+        # The hub doesn't change between captures; stabilize once and
+        # take every shot from the settled state
+        self._stabilize(scene_manager, screen)
 
+        for name, x, y in test_positions:
             path = self._capture_screenshot(screen, name)
             results["screenshots"][name] = path
 
@@ -223,11 +367,8 @@ class VisualRegressionTester:
         ]
 
         for name, frames in moments:
-            for _ in range(frames):
-                scene_manager.update(0.016)
-                screen.fill((0, 0, 0))
-                scene_manager.draw(screen)
-                pygame.display.flip()
+            # The frame counts advance gameplay, not just settling
+            self._stabilize(scene_manager, screen, frames=frames)
 
             path = self._capture_screenshot(screen, name)
             results["screenshots"][name] = path
@@ -249,11 +390,8 @@ class VisualRegressionTester:
         ]
 
         for name, frames in states:
-            for _ in range(frames):
-                scene_manager.update(0.016)
-                screen.fill((0, 0, 0))
-                scene_manager.draw(screen)
-                pygame.display.flip()
+            # The frame counts advance gameplay, not just settling
+            self._stabilize(scene_manager, screen, frames=frames)
 
             path = self._capture_screenshot(screen, name)
             results["screenshots"][name] = path
@@ -275,11 +413,8 @@ class VisualRegressionTester:
         ]
 
         for name, frames in areas:
-            for _ in range(frames):
-                scene_manager.update(0.016)
-                screen.fill((0, 0, 0))
-                scene_manager.draw(screen)
-                pygame.display.flip()
+            # The frame counts advance gameplay, not just settling
+            self._stabilize(scene_manager, screen, frames=frames)
 
             path = self._capture_screenshot(screen, name)
             results["screenshots"][name] = path
@@ -295,11 +430,7 @@ class VisualRegressionTester:
         scene_manager.handle_event(event)
 
         # Update and capture
-        for _ in range(5):
-            scene_manager.update(0.016)
-            screen.fill((0, 0, 0))
-            scene_manager.draw(screen)
-            pygame.display.flip()
+        self._stabilize(scene_manager, screen, frames=5)
 
         path = self._capture_screenshot(screen, "pause_menu")
         results["screenshots"]["pause_menu"] = path
@@ -327,7 +458,6 @@ class VisualRegressionTester:
                 # Draw and capture
                 screen.fill((100, 100, 100))  # Gray background to see transparency
                 player.draw(screen)
-                pygame.display.flip()
 
                 screenshot_name = f"sprite_{character}_{animation}"
                 path = self._capture_screenshot(screen, screenshot_name)
@@ -355,7 +485,6 @@ class VisualRegressionTester:
         for name, render_func in ui_tests:
             screen.fill((50, 50, 50))
             render_func(screen)
-            pygame.display.flip()
 
             path = self._capture_screenshot(screen, f"ui_{name}")
             results["screenshots"][name] = path
@@ -396,7 +525,6 @@ class VisualRegressionTester:
                     screen.fill((0, 0, 0))
                     player.update(0.016)
                     player.draw(screen)
-                    pygame.display.flip()
 
                     if i == 2:  # Middle frame
                         path = self._capture_screenshot(screen, f"anim_{name}_frame{i}")
@@ -412,84 +540,175 @@ class VisualRegressionTester:
         return results
 
     def _capture_screenshot(self, screen: pygame.Surface, name: str) -> str:
-        """Capture and save a screenshot."""
+        """Capture and save a screenshot.
+
+        The PNG on disk is archival; the raw pixels are kept in memory
+        so the analyzers and reference diff skip a PNG encode/decode
+        round-trip per screenshot. The encode itself runs on a worker
+        thread so the test loop isn't blocked behind zlib.
+        """
         filename = f"{name}.png"
         filepath = self.current_test_dir / filename
-        pygame.image.save(screen, str(filepath))
+        array = pygame.surfarray.pixels3d(screen).swapaxes(0, 1).copy()
+        self.screenshot_arrays[name] = array
+        self._pending_saves[str(filepath)] = self._save_pool.submit(
+            _write_png, array, filepath
+        )
         return str(filepath)
 
+    def _record_reference_size(self, test_name: str, path) -> None:
+        """Persist a new reference's dimensions to the manifest."""
+        self._reference_sizes[test_name] = list(_png_size(path))
+        with open(self._manifest_path, "w") as f:
+            json.dump(self._reference_sizes, f, indent=2)
+
+    def _wait_for_save(self, path: str) -> None:
+        """Block until an async screenshot save for ``path`` has landed."""
+        pending = self._pending_saves.pop(str(path), None)
+        if pending is not None:
+            pending.result()
+
     def _compare_with_reference(
         self, current_path: str, test_name: str
     ) -> VisualRegression | None:
         """Compare current screenshot with reference."""
         reference_path = self.reference_dir / f"{test_name}.png"
 
+        # The byte fast path and the reference copy both read the
+        # current file from disk
+        self._wait_for_save(current_path)
+
         if not reference_path.exists():
             # No reference exists, save current as reference
             import shutil
 
             shutil.copy(current_path, reference_path)
+            self._record_reference_size(test_name, reference_path)
             print(f"📸 Saved new reference: {test_name}")
             return None
 
-        # Load images
-        current_img = Image.open(current_path)
-        reference_img = Image.open(reference_path)
+        # The manifest answers the size check without decoding either
+        # image; current dimensions come from the in-memory capture or
+        # the PNG header
+        expected_size = self._reference_sizes.get(test_name)
+        if expected_size is not None:
+            captured = self.screenshot_arrays.get(test_name)
+            if captured is not None:
+                current_size = (captured.shape[1], captured.shape[0])
+            else:
+                current_size = _png_size(current_path)
+            if tuple(expected_size) != current_size:
+                return VisualRegression(
+                    scene=test_name,
+                    test_name=test_name,
+                    difference_percentage=100.0,
+                    pixel_diff_count=0,
+                    description=f"Image dimensions differ: {current_size} vs {tuple(expected_size)}",
+                    reference_path=str(reference_path),
+                    current_path=current_path,
+                    diff_path="",
+                )
 
-        # Check dimensions
-        if current_img.size != reference_img.size:
+        # Byte-identical files cannot differ visually, and a raw read
+        # plus memcmp is orders of magnitude cheaper than decoding two
+        # PNGs and diffing them — the common case for stable references
+        with open(current_path, "rb") as cur, open(reference_path, "rb") as ref:
+            if cur.read() == ref.read():
+                return None
+
+        # The capture kept the current pixels in memory (RGB); only the
+        # reference needs a decode. cv2 loads BGR, so the in-memory
+        # capture is swapped to match before diffing
+        current_array = self.screenshot_arrays.get(test_name)
+        reference_array = _load_reference(str(reference_path))
+        if current_array is None:
+            current_array = _read_image(current_path)
+        elif cv2 is not None:
+            current_array = cv2.cvtColor(current_array, cv2.COLOR_RGB2BGR)
+
+        # Check dimensions (backstop for references predating the
+        # manifest)
+        if current_array.shape != reference_array.shape:
+            current_size = current_array.shape[1::-1]
+            reference_size = reference_array.shape[1::-1]
             return VisualRegression(
                 scene=test_name,
                 test_name=test_name,
                 difference_percentage=100.0,
                 pixel_diff_count=0,
-                description=f"Image dimensions differ: {current_img.size} vs {reference_img.size}",
+                description=f"Image dimensions differ: {current_size} vs {reference_size}",
                 reference_path=str(reference_path),
                 current_path=current_path,
                 diff_path="",
             )
 
-        # Calculate difference
-        diff = ImageChops.difference(current_img, reference_img)
-        stat = ImageStat.Stat(diff)
-
-        # Calculate difference percentage
-        diff_ratio = sum(stat.mean) / (len(stat.mean) * 255)
-        diff_percentage = diff_ratio * 100
-
-        if diff_percentage > 1.0:  # 1% threshold
-            # Save diff image
-            diff_path = self.current_test_dir / f"{test_name}_diff.png"
-            diff.save(diff_path)
-
-            # Count different pixels
-            diff_array = np.array(diff)
-            pixel_diff_count = np.sum(
-                diff_array > 10
-            )  # Pixels with significant difference
-
-            return VisualRegression(
-                scene=test_name,
-                test_name=test_name,
-                difference_percentage=diff_percentage,
-                pixel_diff_count=pixel_diff_count,
-                description=f"Visual difference detected: {diff_percentage:.2f}%",
-                reference_path=str(reference_path),
-                current_path=current_path,
-                diff_path=str(diff_path),
-            )
+        # Calculate difference in one pass: absdiff, then mean and
+        # changed-pixel count off the same buffer instead of
+        # ImageChops + ImageStat + a second np.array conversion. The
+        # diff lands in the reused instance buffer
+        if self._diff_buf is None or self._diff_buf.shape != current_array.shape:
+            self._diff_buf = np.empty_like(current_array)
+        diff_array = _absdiff(current_array, reference_array, out=self._diff_buf)
+
+        # Calculate difference percentage and exit on the common
+        # no-regression case before any further allocation
+        diff_percentage = diff_array.mean() / 255 * 100
+        if diff_percentage <= 1.0:  # 1% threshold
+            return None
 
-        return None
+        # Save diff image (only built when the threshold triggers)
+        diff_path = self.current_test_dir / f"{test_name}_diff.png"
+        _write_image(diff_path, diff_array)
+
+        # Count pixels with a significant difference in any channel
+        pixel_diff_count = int((diff_array > 10).any(axis=-1).sum())
+
+        return VisualRegression(
+            scene=test_name,
+            test_name=test_name,
+            difference_percentage=diff_percentage,
+            pixel_diff_count=pixel_diff_count,
+            description=f"Visual difference detected: {diff_percentage:.2f}%",
+            reference_path=str(reference_path),
+            current_path=current_path,
+            diff_path=str(diff_path),
+        )
 
     def _analyze_screenshot_for_bugs(
         self, screenshot_path: str, test_name: str, screenshot_name: str
     ) -> None:
         """Analyze screenshot for common visual bugs."""
-        img = Image.open(screenshot_path)
-        img_array = np.array(img)
-
-        for bug_type, detect_func in self.bug_patterns.items():
-            bug_info = detect_func(img_array, screenshot_name)
+        img_array = self.screenshot_arrays.get(screenshot_name)
+        if img_array is None:
+            # Result keys don't always match capture names; fall back
+            # to decoding the archived PNG
+            self._wait_for_save(screenshot_path)
+            img_array = _read_image(screenshot_path)
+
+        # Downsample once for all detectors; their thresholds are
+        # expressed in downsampled pixels
+        if cv2 is not None:
+            small = cv2.resize(
+                img_array,
+                (
+                    img_array.shape[1] // _DOWNSAMPLE,
+                    img_array.shape[0] // _DOWNSAMPLE,
+                ),
+                interpolation=cv2.INTER_AREA,
+            )
+        else:
+            small = img_array[::_DOWNSAMPLE, ::_DOWNSAMPLE]
+
+        # The detectors are independent read-only passes and NumPy
+        # releases the GIL on large-array ops, so they run concurrently;
+        # results print in registration order once all have finished
+        with ThreadPoolExecutor(max_workers=len(self.bug_patterns)) as pool:
+            futures = {
+                bug_type: pool.submit(detect_func, small, screenshot_name)
+                for bug_type, detect_func in self.bug_patterns.items()
+            }
+        for bug_type, future in futures.items():
+            bug_info = future.result()
             if bug_info:
                 print(f"⚠️  {bug_type} detected in {screenshot_name}: {bug_info}")
 
@@ -498,9 +717,33 @@ class VisualRegressionTester:
         # Check for large black rectangles that might be missing sprites
         height, width = img_array.shape[:2]
 
-        # Look for rectangular regions that are completely black
+        # Look for rectangular regions that are completely black. A
+        # channel-max reduction plus one compare builds the mask in a
+        # single pass; np.all over three per-channel compares
+        # materializes two extra intermediates
         black_threshold = 10
-        is_black = np.all(img_array[:, :, :3] < black_threshold, axis=2)
+        is_black = img_array[:, :, :3].max(axis=2) < black_threshold
+
+        if cv2 is not None:
+            # One labeling pass returns every component's area and
+            # bounding box — no per-label mask rebuild or np.where
+            num_features, _, stats, _ = cv2.connectedComponentsWithStats(
+                is_black.astype(np.uint8), connectivity=8
+            )
+            for x_min, y_min, box_w, box_h, region_size in stats[1:]:
+                # If region is larger than 32x32 screen pixels and
+                # mostly fills its bounding box, might be a missing
+                # sprite; coordinates are reported at full resolution
+                if (
+                    region_size > (32 // _DOWNSAMPLE) ** 2
+                    and region_size > box_w * box_h * 0.8
+                ):
+                    return (
+                        f"Possible missing sprite at "
+                        f"({x_min * _DOWNSAMPLE}, {y_min * _DOWNSAMPLE}) size: "
+                        f"{(box_w - 1) * _DOWNSAMPLE}x{(box_h - 1) * _DOWNSAMPLE}"
+                    )
+            return None
 
         # Find large contiguous black regions
         from scipy import ndimage
@@ -511,8 +754,9 @@ class VisualRegressionTester:
             region_mask = labeled == i
             region_size = np.sum(region_mask)
 
-            # If region is larger than 32x32 pixels, might be missing sprite
-            if region_size > 1024:
+            # If region is larger than 32x32 screen pixels, might be
+            # missing sprite
+            if region_size > (32 // _DOWNSAMPLE) ** 2:
                 y_coords, x_coords = np.where(region_mask)
                 y_min, y_max = y_coords.min(), y_coords.max()
                 x_min, x_max = x_coords.min(), x_coords.max()
@@ -520,7 +764,11 @@ class VisualRegressionTester:
                 # Check if it's a rectangular region (likely sprite placeholder)
                 expected_size = (y_max - y_min + 1) * (x_max - x_min + 1)
                 if region_size > expected_size * 0.8:  # 80% filled
-                    return f"Possible missing sprite at ({x_min}, {y_min}) size: {x_max - x_min}x{y_max - y_min}"
+                    return (
+                        f"Possible missing sprite at "
+                        f"({x_min * _DOWNSAMPLE}, {y_min * _DOWNSAMPLE}) size: "
+                        f"{(x_max - x_min) * _DOWNSAMPLE}x{(y_max - y_min) * _DOWNSAMPLE}"
+                    )
 
         return None
 
@@ -542,8 +790,9 @@ class VisualRegressionTester:
         # Look for sprites cut off at screen edges
         height, width = img_array.shape[:2]
 
-        # Check edges for partial sprites
-        edge_threshold = 10
+        # Check edges for partial sprites (~10 screen pixels at the
+        # detector downsample)
+        edge_threshold = max(1, 10 // _DOWNSAMPLE)
 
         # Check if non-background pixels touch the edges
         edges = [
@@ -555,18 +804,28 @@ class VisualRegressionTester:
 
         for edge_name, edge_pixels in edges:
             # If we find sprite-like patterns at the edge, might be clipping
-            non_black = np.any(edge_pixels[:, :, :3] > 50, axis=2)
-            if np.sum(non_black) > edge_pixels.shape[0] * edge_pixels.shape[1] * 0.3:
+            if _edge_nonblack_fraction(edge_pixels[:, :, :3]) > 0.3:
                 return f"Possible sprite clipping at {edge_name} edge"
 
         return None
 
     def _detect_color_corruption(self, img_array: np.ndarray, name: str) -> str | None:
         """Detect color corruption or palette issues."""
-        # Check for unusual color distributions
-        unique_colors = len(
-            np.unique(img_array.reshape(-1, img_array.shape[2]), axis=0)
-        )
+        # Check for unusual color distributions. Packing RGB into one
+        # uint32 keeps np.unique on its fast 1-D path instead of a lex
+        # sort over (N, 3) rows
+        rgb = img_array[:, :, :3].astype(np.uint32)
+        packed = ((rgb[:, :, 0] << 16) | (rgb[:, :, 1] << 8) | rgb[:, :, 2]).ravel()
+
+        # A 1024-pixel subsample is statistically plenty for an "at
+        # least 10 colors" test; only near-monochrome frames reach the
+        # full scan. The fixed seed keeps the detector reproducible
+        if packed.size > 1024:
+            idx = np.random.default_rng(0).choice(packed.size, 1024, replace=False)
+            if np.unique(packed[idx]).size >= 10:
+                return None
+
+        unique_colors = int(np.unique(packed).size)
 
         # If very few colors, might indicate palette problem
         if unique_colors < 10:
@@ -612,7 +871,21 @@ class VisualRegressionTester:
 
         # Check for transparency issues
         # Gray background should be visible around sprite edges
-        gray_count = np.sum(np.all(pixels == [100, 100, 100], axis=2))
+        if cv2 is not None:
+            # inRange + countNonZero are SIMD reductions and skip the
+            # bool mask + generic sum entirely
+            mask = cv2.inRange(
+                np.ascontiguousarray(pixels), (100, 100, 100), (100, 100, 100)
+            )
+            gray_count = int(cv2.countNonZero(mask))
+        else:
+            # Pack RGB into one uint32 so the test is a single 32-bit
+            # compare per pixel instead of three byte compares plus an
+            # AND reduce
+            packed = pixels.astype(np.uint32)
+            key = (packed[..., 0] << 16) | (packed[..., 1] << 8) | packed[..., 2]
+            gray = (100 << 16) | (100 << 8) | 100
+            gray_count = int((key == gray).sum())
         total_pixels = pixels.shape[0] * pixels.shape[1]
 
         if gray_count < total_pixels * 0.5:  # Less than 50% background visible
@@ -671,18 +944,25 @@ class VisualRegressionTester:
         """Detect glitches in animation sequences."""
         glitches = []
 
-        # Load frames
-        frames = [Image.open(path) for path in frame_paths]
-
-        # Check for sudden changes between frames
-        for i in range(1, len(frames)):
-            prev_frame = np.array(frames[i - 1])
-            curr_frame = np.array(frames[i])
-
-            # Calculate frame difference
-            diff = np.abs(prev_frame.astype(float) - curr_frame.astype(float))
-            avg_diff = np.mean(diff)
-
+        if len(frame_paths) < 2:
+            return glitches
+
+        def load_frame(path: str) -> np.ndarray:
+            # Captures are named after their file stem; prefer the
+            # in-memory pixels over re-decoding the PNG
+            array = self.screenshot_arrays.get(Path(path).stem)
+            if array is None:
+                self._wait_for_save(path)
+                array = _read_image(path)
+            return array
+
+        # Check for sudden changes between frames: one batched int16
+        # diff over the stacked sequence instead of a float upcast and
+        # mean per pair
+        stack = np.stack([load_frame(path) for path in frame_paths]).astype(np.int16)
+        avg_diffs = np.abs(np.diff(stack, axis=0)).mean(axis=(1, 2, 3))
+
+        for i, avg_diff in enumerate(avg_diffs, start=1):
             # Large sudden change might indicate glitch
             if avg_diff > 100:  # Threshold
                 glitches.append(
@@ -693,6 +973,13 @@ class VisualRegressionTester:
 
     def _generate_report(self, results: dict[str, any]) -> dict[str, any]:
         """Generate visual test report."""
+        # Drain queued screenshot encodes so the archived artifacts are
+        # complete before the report points at them
+        for future in self._pending_saves.values():
+            future.result()
+        self._pending_saves.clear()
+        self._save_pool.shutdown()
+
         report = {
             "timestamp": datetime.now().isoformat(),
             "total_tests": len(results),